@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
@@ -22,6 +23,10 @@ from cloudshell.shell.standards.exceptions import ResourceModelException
 if TYPE_CHECKING:
     from cloudshell.shell.core.driver_context import AutoLoadDetails
 
+    from cloudshell.shell.standards.core.autoload.autoload_delta import AutoloadDelta
+    from cloudshell.shell.standards.core.autoload.details_cache import (
+        AutoloadDetailsCache,
+    )
     from cloudshell.shell.standards.core.resource_conf import BaseConfig
 
 
@@ -52,7 +57,19 @@ class GenericResourceModel(AbstractResource):
         shell_name: str,
         family_name: str,
         api: CloudShellAPISession,
+        existed_resource_info: ExistedResourceInfo | None = None,
+        legacy_unique_ids: bool = False,
     ):
+        """Generic resource model.
+
+        existed_resource_info can be used to customize loading of the existed
+        resource, e.g. ExistedResourceInfo(resource_name, api, max_workers=4)
+        or ExistedResourceInfo(resource_name, api, lazy_uniq_ids=True), to share
+        loading between concurrent commands use
+        EXISTED_RESOURCE_INFO_REGISTRY.get(resource_name, api)
+        legacy_unique_ids it's for unique ids of the new sub resources generated
+        with the built-in hash(), they are different on every autoload
+        """
         if family_name not in self.SUPPORTED_FAMILY_NAMES:
             families = ", ".join(self.SUPPORTED_FAMILY_NAMES)
             raise ResourceModelException(
@@ -61,7 +78,10 @@ class GenericResourceModel(AbstractResource):
             )
         super().__init__(None, shell_name, name=resource_name, family_name=family_name)
         self._api = api
-        self._existed_resource_info = ExistedResourceInfo(resource_name, api)
+        self._legacy_unique_ids = legacy_unique_ids
+        if existed_resource_info is None:
+            existed_resource_info = ExistedResourceInfo(resource_name, api)
+        self._existed_resource_info = existed_resource_info
         self._existed_resource_info.load_data()
 
     @property
@@ -80,19 +100,63 @@ class GenericResourceModel(AbstractResource):
         )
 
     @classmethod
-    def from_resource_config(cls, resource_config: BaseConfig) -> Self:
+    def from_resource_config(
+        cls,
+        resource_config: BaseConfig,
+        existed_resource_info: ExistedResourceInfo | None = None,
+        legacy_unique_ids: bool = False,
+    ) -> Self:
         return cls(
             resource_config.name,
             resource_config.shell_name,
             resource_config.family_name,
             api=resource_config.api,
+            existed_resource_info=existed_resource_info,
+            legacy_unique_ids=legacy_unique_ids,
         )
 
-    def build(self) -> AutoLoadDetails:
-        return AutoloadDetailsBuilder(self, self._existed_resource_info).build_details()
+    def build(
+        self, details_cache: AutoloadDetailsCache | None = None
+    ) -> AutoLoadDetails:
+        """Build autoload details.
+
+        details_cache keeps the output between autoloads to reuse it for the not
+        changed subtrees
+        """
+        return self._create_builder(details_cache).build_details()
+
+    def build_pages(
+        self, max_resources: int = 1000, max_attributes: int = 10000
+    ) -> list[AutoLoadDetails]:
+        """Build autoload details split into pages to submit them one by one.
+
+        See AutoloadDetailsBuilder.build_details_pages.
+        """
+        return self._create_builder().build_details_pages(max_resources, max_attributes)
+
+    def build_delta(
+        self, previous: AutoLoadDetails | None = None, include_orphans: bool = False
+    ) -> AutoloadDelta:
+        """Build autoload details for new and changed resources only.
+
+        See AutoloadDetailsBuilder.build_details_delta.
+        """
+        return self._create_builder().build_details_delta(previous, include_orphans)
+
+    def build_iter(self, chunk_size: int = 1000) -> Iterator[AutoLoadDetails]:
+        """Yield autoload details in chunks, see build_details_iter."""
+        return self._create_builder().build_details_iter(chunk_size)
+
+    def _create_builder(
+        self, details_cache: AutoloadDetailsCache | None = None
+    ) -> AutoloadDetailsBuilder:
+        return AutoloadDetailsBuilder(
+            self, self._existed_resource_info, self._legacy_unique_ids, details_cache
+        )
 
 
 class GenericChassis(AbstractResource):
+    __slots__ = ()
     _RELATIVE_ADDRESS_PREFIX = "CH"
     _NAME_TEMPLATE = "Chassis {}"
     _FAMILY_NAME = "CS_Chassis"
@@ -117,8 +181,31 @@ class GenericChassis(AbstractResource):
         """Connect port sub resource."""
         self._add_sub_resource_with_type_restrictions(port, [GenericPort])
 
+    def connect_ports(
+        self,
+        indexes: Sequence[Any],
+        names: Sequence[str | None] | None = None,
+        unique_ids: Sequence[str | None] | None = None,
+        port_cls: type[GenericPort] | None = None,
+        **attributes: Sequence[Any],
+    ) -> list[GenericPort]:
+        """Create ports from the columns of values and connect them.
+
+        port_cls it's GenericPort by default, attributes are columns named as
+        the attributes of the port class, e.g. mac_address=[...], mtu=[...]
+        """
+        return self._connect_resources_from_columns(
+            port_cls or GenericPort,
+            [GenericPort],
+            indexes,
+            names,
+            unique_ids,
+            attributes,
+        )
+
 
 class GenericModule(AbstractResource):
+    __slots__ = ()
     _RELATIVE_ADDRESS_PREFIX = "M"
     _NAME_TEMPLATE = "Module {}"
     _FAMILY_NAME = "CS_Module"
@@ -140,8 +227,31 @@ class GenericModule(AbstractResource):
         """Connect port sub resource."""
         self._add_sub_resource_with_type_restrictions(port, [GenericPort])
 
+    def connect_ports(
+        self,
+        indexes: Sequence[Any],
+        names: Sequence[str | None] | None = None,
+        unique_ids: Sequence[str | None] | None = None,
+        port_cls: type[GenericPort] | None = None,
+        **attributes: Sequence[Any],
+    ) -> list[GenericPort]:
+        """Create ports from the columns of values and connect them.
+
+        port_cls it's GenericPort by default, attributes are columns named as
+        the attributes of the port class, e.g. mac_address=[...], mtu=[...]
+        """
+        return self._connect_resources_from_columns(
+            port_cls or GenericPort,
+            [GenericPort],
+            indexes,
+            names,
+            unique_ids,
+            attributes,
+        )
+
 
 class GenericSubModule(AbstractResource):
+    __slots__ = ()
     _RELATIVE_ADDRESS_PREFIX = "SM"
     _NAME_TEMPLATE = "SubModule {}"
     _FAMILY_NAME = "CS_SubModule"
@@ -159,8 +269,26 @@ class GenericSubModule(AbstractResource):
         """Connect port sub resource."""
         self._add_sub_resource_with_type_restrictions(port, [BasePort])
 
+    def connect_ports(
+        self,
+        indexes: Sequence[Any],
+        names: Sequence[str | None] | None = None,
+        unique_ids: Sequence[str | None] | None = None,
+        port_cls: type[BasePort] | None = None,
+        **attributes: Sequence[Any],
+    ) -> list[BasePort]:
+        """Create ports from the columns of values and connect them.
+
+        port_cls it's GenericPort by default, attributes are columns named as
+        the attributes of the port class, e.g. mac_address=[...], mtu=[...]
+        """
+        return self._connect_resources_from_columns(
+            port_cls or GenericPort, [BasePort], indexes, names, unique_ids, attributes
+        )
+
 
 class BasePort(AbstractResource):
+    __slots__ = ()
     _RELATIVE_ADDRESS_PREFIX = "P"
     _NAME_TEMPLATE = "Port {}"
     _FAMILY_NAME = "CS_Port"
@@ -176,10 +304,12 @@ class BasePort(AbstractResource):
 
 
 class ResourcePort(BasePort):
+    __slots__ = ()
     port_speed = ResourceAttribute(attribute_names.PORT_SPEED, default_value=0)
 
 
 class GenericPort(BasePort):
+    __slots__ = ()
     # Attributes
     port_description = ResourceAttribute(attribute_names.PORT_DESCRIPTION)
     auto_negotiation = ResourceAttribute(attribute_names.AUTO_NEGOTIATION)
@@ -191,6 +321,7 @@ class GenericPort(BasePort):
 
 
 class GenericPowerPort(AbstractResource):
+    __slots__ = ()
     _RESOURCE_MODEL = "GenericPowerPort"
     _RELATIVE_ADDRESS_PREFIX = "PP"
     _NAME_TEMPLATE = "Power Port {}"
@@ -207,6 +338,7 @@ class GenericPowerPort(AbstractResource):
 
 
 class GenericPortChannel(AbstractResource):
+    __slots__ = ()
     _RESOURCE_MODEL = "GenericPortChannel"
     _RELATIVE_ADDRESS_PREFIX = "PC"
     _NAME_TEMPLATE = "Port Channel{}"
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+
+from cloudshell.api.cloudshell_api import CloudShellAPISession, ResourceInfo
+
+from cloudshell.shell.standards.core.autoload.existed_resource_info import (
+    BaseExistedResourceInfo,
+)
+from cloudshell.shell.standards.core.autoload.existed_resource_stats import (
+    ExistedResourceInfoStats,
+)
+from cloudshell.shell.standards.core.autoload.retry_policy import RetryPolicy
+from cloudshell.shell.standards.core.autoload.snapshot_store import (
+    ExistedResourceSnapshotStore,
+)
+from cloudshell.shell.standards.exceptions import (
+    BaseStandardException,
+    ExistedResourceInfoCancelled,
+    ExistedResourceInfoTimeout,
+)
+
+
+class AsyncExistedResourceInfo(BaseExistedResourceInfo):
+    """Collects information about existed resource from the CloudShell in asyncio.
+
+    api can be CloudShellAPISession, its calls are run in the executor, or an async
+        adapter with coroutine GetResourceDetails method
+    max_concurrency it's a number of children of the root resource loaded at once
+    executor used for the sync API calls, by default the loop's default executor
+    load_timeout it's a time budget in seconds for the whole loading, when it's
+        exceeded the loading fails with ExistedResourceInfoTimeout
+    retry_policy if set failed GetResourceDetails calls are retried with it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        api: CloudShellAPISession,
+        max_concurrency: int = 8,
+        executor: Executor | None = None,
+        snapshot_store: ExistedResourceSnapshotStore | None = None,
+        load_timeout: float | None = None,
+        compact_maps: bool = False,
+        stats_callback: Callable[[ExistedResourceInfoStats], None] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        if max_concurrency < 1:
+            raise BaseStandardException("max_concurrency should be greater than 0")
+        super().__init__(name, api, snapshot_store, compact_maps, stats_callback)
+        self._max_concurrency = max_concurrency
+        self._executor = executor
+        self._load_timeout = load_timeout
+        self._retry_policy = retry_policy
+        self._task: asyncio.Future | None = None
+
+    @property
+    async def uniq_id(self) -> str:
+        await self.wait_until_loaded()
+        return self._uniq_id
+
+    async def get_uniq_id(self, full_name: str) -> str | None:
+        await self.wait_until_loaded()
+        return self._full_name_to_uniq_id.get(full_name)
+
+    async def get_address(self, full_name: str) -> str | None:
+        await self.wait_until_loaded()
+        return self._full_name_to_address.get(full_name)
+
+    async def is_address_exists(self, relative_address: str) -> bool:
+        await self.wait_until_loaded()
+        return relative_address in self._address_to_full_name
+
+    async def get_full_name_by_unique_id(self, unique_id: str) -> str | None:
+        await self.wait_until_loaded()
+        return self._uniq_id_to_full_name.get(unique_id)
+
+    async def get_full_names(self) -> list[str]:
+        await self.wait_until_loaded()
+        return list(self._full_name_to_address)
+
+    def load_data(self) -> None:
+        """Start loading in the running event loop."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._load_data_with_timeout())
+
+    async def wait_until_loaded(self, timeout: float | None = None) -> None:
+        """Wait until the data is loaded and re-raise an error of the loading.
+
+        timeout limits the waiting of the caller only, the loading itself is
+        limited by load_timeout
+        """
+        if self._task is None:
+            raise BaseStandardException("You have to start loading first")
+        if self._task.done():
+            done = {self._task}
+        else:
+            start = time.perf_counter()
+            # asyncio.wait doesn't cancel the loading if the waiter is cancelled
+            done, _ = await asyncio.wait({self._task}, timeout=timeout)
+            self._stats.add_wait_time(time.perf_counter() - start)
+        if not done:
+            raise ExistedResourceInfoTimeout(
+                f"Loading of the {self.name} isn't finished in {timeout} seconds"
+            )
+        if self._task.cancelled():
+            raise ExistedResourceInfoCancelled(
+                f"Loading of the {self.name} is cancelled"
+            )
+        self._task.result()
+
+    def cancel(self) -> None:
+        """Cancel the loading, waiters get ExistedResourceInfoCancelled."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _load_data_with_timeout(self) -> None:
+        start = time.perf_counter()
+        task = asyncio.ensure_future(self._load_data())
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self._load_timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            self._finish_stats(time.perf_counter() - start)
+        if not done:
+            task.cancel()
+            raise ExistedResourceInfoTimeout(
+                f"Loading of the {self.name} isn't finished in "
+                f"{self._load_timeout} seconds"
+            )
+        task.result()
+
+    async def _load_data(self) -> None:
+        r_info = await self._get_resource_details(self.name)
+        if self._load_stored_snapshot(r_info):
+            return
+
+        # Root resource contains invalid uniq id for children but newly loaded child
+        # info contains valid uniq id for itself and its children
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def get_child_details(child_name: str) -> ResourceInfo:
+            async with semaphore:
+                return await self._get_resource_details(child_name)
+
+        children = await asyncio.gather(
+            *(get_child_details(child.Name) for child in r_info.ChildResources)
+        )
+        for updated_child in children:
+            self._build_maps_for_resource(updated_child)
+        self._save_snapshot()
+
+    async def _get_resource_details(self, name: str) -> ResourceInfo:
+        if self._retry_policy:
+            return await self._retry_policy.call_async(
+                self._call_get_resource_details, name
+            )
+        return await self._call_get_resource_details(name)
+
+    async def _call_get_resource_details(self, name: str) -> ResourceInfo:
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(self._api.GetResourceDetails):
+                return await self._api.GetResourceDetails(name)
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self._executor, self._api.GetResourceDetails, name
+            )
+        finally:
+            self._stats.add_api_call(time.perf_counter() - start)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from attrs import define, field
+
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+
+
+@define
+class AutoloadDelta:
+    """Autoload details reduced to the new and changed resources.
+
+    details contains new resources with all their attributes and changed
+        resources with the changed attributes only
+    new, changed and unchanged are full names of the discovered resources
+    orphans are full names of the existed resources which are not discovered, they
+        are collected only if it's requested
+    """
+
+    details: AutoLoadDetails
+    new: list[str] = field(factory=list)
+    changed: list[str] = field(factory=list)
+    unchanged: list[str] = field(factory=list)
+    orphans: list[str] = field(factory=list)
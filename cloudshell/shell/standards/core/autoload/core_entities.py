@@ -1,19 +1,48 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import itertools
+import sys
+from collections.abc import Sequence
 from typing import Any
 
 from cloudshell.shell.standards.core.utils import attr_length_validator
+from cloudshell.shell.standards.exceptions import ResourceModelException
+
+
+class ModelVersion:
+    """Versions of the trees of the resource models.
+
+    The version is kept by the root RelativeAddress of the tree, it's changed on
+    every change of the names, indexes or parents in the tree. Cached names and
+    addresses are valid while the version of their tree is the same. Versions are
+    taken from one counter, so different trees never have the same version.
+    """
+
+    _counter = itertools.count(1)
+
+    @classmethod
+    def new_version(cls) -> int:
+        return next(cls._counter)
 
 
 class AttributeContainer:
     """Contains Attributes."""
 
+    __slots__ = ("attributes",)
+
     def __init__(self):
         self.attributes: dict[AttributeName, Any] = {}
 
 
 class AttributeName:
+    """Key of the attribute in the container, str of it is the full name.
+
+    It's equal to its AttributeModel, so values are got by the model without
+    creating a new AttributeName.
+    """
+
+    __slots__ = ("_attribute_model", "_attribute_container")
+
     def __init__(
         self, attribute_model: AttributeModel, attribute_container: AttributeContainer
     ):
@@ -27,10 +56,12 @@ class AttributeName:
         return self.to_string()
 
     def __hash__(self):
-        return hash(self._attribute_model)
+        return self._attribute_model._hash
 
-    def __eq__(self, other: AttributeName) -> bool:
-        return self._attribute_model == other._attribute_model
+    def __eq__(self, other: AttributeName | AttributeModel) -> bool:
+        if isinstance(other, AttributeName):
+            other = other._attribute_model
+        return self._attribute_model == other
 
 
 class AttributeModel:
@@ -39,8 +70,9 @@ class AttributeModel:
     MAX_LENGTH = 2000
 
     def __init__(self, name: str, default_value: Any = None):
-        self.name = name
+        self.name = sys.intern(name)
         self.default_value = default_value
+        self._hash = hash(self.name)
 
     def attribute_name(self, instance):
         return self.name
@@ -49,37 +81,80 @@ class AttributeModel:
         if instance is None:
             return self
 
-        return instance.attributes.get(
-            AttributeName(self, instance), self.default_value
-        )
+        # the model is equal to the AttributeName key
+        return instance.attributes.get(self, self.default_value)
 
     @attr_length_validator(MAX_LENGTH)
     def __set__(self, instance: AttributeContainer, value: Any) -> None:
         value = value or self.default_value
-        instance.attributes[AttributeName(self, instance)] = value
+        attributes = instance.attributes
+        if self in attributes:
+            # the existed key is kept
+            attributes[self] = value
+        else:
+            attributes[AttributeName(self, instance)] = value
+
+    def set_values(
+        self, instances: Sequence[AttributeContainer], values: Sequence[Any]
+    ) -> None:
+        """Set the attribute for every instance in one pass.
+
+        values it's a column with a value for every instance, they are truncated
+        as by the setter. NumPy arrays are converted to lists of Python values.
+        """
+        if hasattr(values, "tolist"):
+            # NumPy arrays and array.array
+            values = values.tolist()
+        if len(values) != len(instances):
+            raise ResourceModelException(
+                f"Attribute {self.name} has {len(values)} values for "
+                f"{len(instances)} instances"
+            )
+        max_length = self.MAX_LENGTH
+        default_value = self.default_value
+        for instance, value in zip(instances, values):
+            if isinstance(value, str):
+                value = value[:max_length]
+            value = value or default_value
+            attributes = instance.attributes
+            if self in attributes:
+                attributes[self] = value
+            else:
+                attributes[AttributeName(self, instance)] = value
 
     def __hash__(self):
-        return hash(self.name)
-
-    def __eq__(self, other: AttributeModel) -> bool:
+        return self._hash
+
+    def __eq__(self, other: AttributeModel | AttributeName) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, AttributeName):
+            other = other._attribute_model
+        if not isinstance(other, AttributeModel):
+            return NotImplemented
         return self.name == other.name
 
 
 class InstanceAttribute:
-    """Validates instance attribute."""
+    """Validates instance attribute.
 
-    def __init__(self):
-        self.value_container = {}
+    The value is stored in the instance, so the descriptor doesn't keep
+    the instances alive. Classes with __slots__ should have a slot for it,
+    f"{name}_value".
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._storage_name = f"{name}_value"
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        return self.value_container.get(instance, None)
+        return getattr(instance, self._storage_name, None)
 
     @attr_length_validator(AttributeModel.MAX_LENGTH)
     def __set__(self, instance, value):
-        self.value_container[instance] = value
+        setattr(instance, self._storage_name, value)
 
 
 class RelativeAddress:
@@ -88,8 +163,14 @@ class RelativeAddress:
     class IndexValidator:
         """Validate registered indexes."""
 
+        __slots__ = ("_address_dict",)
+
         def __init__(self):
-            self._address_dict = defaultdict(lambda: defaultdict(list))
+            # prefix: native index: the node or positions of the nodes if there are
+            # several nodes with the same index, positions are set on registration
+            self._address_dict: dict[
+                str, dict[str | None, RelativeAddress | dict[RelativeAddress, int]]
+            ] = {}
 
         @staticmethod
         def _generate_index(index: str, position: int) -> str:
@@ -97,18 +178,32 @@ class RelativeAddress:
             return f"{index}-{position}"
 
         def get_valid(self, node: RelativeAddress) -> str:
-            instance_list = self._address_dict.get(node._prefix, {}).get(
-                node.native_index, []
-            )
-            if node in instance_list and len(instance_list) > 1:
-                return self._generate_index(
-                    node.native_index, instance_list.index(node)
-                )
-            else:
-                return node.native_index
+            registered = self._address_dict.get(node._prefix, {}).get(node.native_index)
+            if isinstance(registered, dict):
+                position = registered.get(node)
+                if position is not None:
+                    return self._generate_index(node.native_index, position)
+            return node.native_index
 
         def register(self, node: RelativeAddress) -> None:
-            self._address_dict[node._prefix][node.native_index].append(node)
+            indexes = self._address_dict.setdefault(node._prefix, {})
+            registered = indexes.get(node.native_index)
+            if registered is None:
+                indexes[node.native_index] = node
+            elif isinstance(registered, dict):
+                registered.setdefault(node, len(registered))
+            elif registered is not node:
+                indexes[node.native_index] = {registered: 0, node: 1}
+
+    __slots__ = (
+        "__parent_node",
+        "__index_validator",
+        "_cached_full_address",
+        "_cache_version",
+        "_tree_version",
+        "_native_index",
+        "_prefix",
+    )
 
     def __init__(
         self,
@@ -117,12 +212,25 @@ class RelativeAddress:
         parent_node: RelativeAddress | None = None,
     ):
         self.__parent_node = None
-        self.__index_validator = RelativeAddress.IndexValidator()
+        # created on registration of the first child
+        self.__index_validator = None
+        self._cached_full_address = None
+        self._cache_version = -1
+        self._tree_version = ModelVersion.new_version()
 
         self.native_index = index
         self._prefix = prefix
         self.parent_node = parent_node
 
+    @property
+    def native_index(self) -> str | None:
+        return self._native_index
+
+    @native_index.setter
+    def native_index(self, value: str | None) -> None:
+        self._native_index = value
+        self._invalidate_tree()
+
     @property
     def index(self) -> str | None:
         """Validated index."""
@@ -135,14 +243,31 @@ class RelativeAddress:
     def index(self, value: str) -> None:
         self.native_index = value
 
+    def _get_root(self) -> RelativeAddress:
+        node = self
+        while node.__parent_node is not None:
+            node = node.__parent_node
+        return node
+
+    def _get_tree_version(self) -> int:
+        return self._get_root()._tree_version
+
+    def _invalidate_tree(self) -> None:
+        """Change the version of the tree, cached values in it are rebuilt."""
+        self._get_root()._tree_version = ModelVersion.new_version()
+
     @property
     def _full_address(self) -> str:
-        if self.parent_node and self.parent_node._full_address:
-            return (
-                f"{self.parent_node._full_address}"
-                f"{self.ADDRESS_SEPARATOR}"
-                f"{self._local_address}"
-            )
+        version = self._get_tree_version()
+        if self._cache_version != version:
+            self._cached_full_address = self._build_full_address()
+            self._cache_version = version
+        return self._cached_full_address
+
+    def _build_full_address(self) -> str:
+        parent_address = self.parent_node and self.parent_node._full_address
+        if parent_address:
+            return f"{parent_address}{self.ADDRESS_SEPARATOR}{self._local_address}"
         elif self.index:
             return self._local_address
         else:
@@ -156,7 +281,10 @@ class RelativeAddress:
     def parent_node(self, node: RelativeAddress | None) -> None:
         if node:
             self.__parent_node = node
+            if node.__index_validator is None:
+                node.__index_validator = RelativeAddress.IndexValidator()
             node.__index_validator.register(self)
+            self._invalidate_tree()
 
     @property
     def _local_address(self) -> str:
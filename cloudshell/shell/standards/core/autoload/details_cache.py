@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+from cloudshell.shell.core.driver_context import AutoLoadDetails
+
+# relative address, resources range, attributes range, number of the subtrees in
+# the subtree including itself
+RANGE_TYPE = Tuple[str, int, int, int, int, int]
+
+
+class AutoloadDetailsCache:
+    """Autoload details of the last build stored by fingerprints of the subtrees.
+
+    The builder reuses the output of a subtree if its fingerprint and relative
+    address are the same as in the last build and the root resource has the same
+    unique id on the CloudShell. Addresses and unique ids of the existed sub
+    resources are taken from the CloudShell, so the cache should be cleared if the
+    resource is changed on the CloudShell not by the autoload.
+    """
+
+    def __init__(self):
+        self._details = AutoLoadDetails([], [])
+        self._uniq_id: str | None = None
+        # fingerprints of the subtrees in post-order, a subtree follows its
+        # sub subtrees
+        self._ranges: dict[str, RANGE_TYPE] = {}
+        self._fingerprints: list[str] = []
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def get(
+        self, fingerprint: str, relative_address: str, uniq_id: str
+    ) -> tuple[AutoLoadDetails, dict[str, RANGE_TYPE]] | None:
+        """Return the details of the subtree from the last build or None.
+
+        uniq_id it's the unique id of the root resource on the CloudShell
+        Ranges of the subtree and its sub subtrees are returned with the details,
+        they are relative to the start of the subtree.
+        """
+        if uniq_id != self._uniq_id:
+            return None
+        try:
+            address, r_start, r_end, a_start, a_end, size = self._ranges[fingerprint]
+        except KeyError:
+            return None
+        if address != relative_address:
+            return None
+
+        position = self._positions[fingerprint]
+        ranges = {}
+        for sub_fingerprint in self._fingerprints[position - size + 1 : position + 1]:
+            (
+                address,
+                sub_r_start,
+                sub_r_end,
+                sub_a_start,
+                sub_a_end,
+                sub_size,
+            ) = self._ranges[sub_fingerprint]
+            ranges[sub_fingerprint] = (
+                address,
+                sub_r_start - r_start,
+                sub_r_end - r_start,
+                sub_a_start - a_start,
+                sub_a_end - a_start,
+                sub_size,
+            )
+        details = AutoLoadDetails(
+            self._details.resources[r_start:r_end],
+            self._details.attributes[a_start:a_end],
+        )
+        return details, ranges
+
+    def update(
+        self,
+        details: AutoLoadDetails,
+        ranges: dict[str, RANGE_TYPE],
+        uniq_id: str,
+    ) -> None:
+        """Replace the stored details with the details of the new build.
+
+        ranges it's a relative address, ranges of the resources and the attributes
+            in the details and a number of the subtrees for every fingerprint of
+            the subtree in post-order
+        uniq_id it's the unique id of the root resource on the CloudShell
+        """
+        # the caller can change the lists of the returned details
+        self._details = AutoLoadDetails(
+            list(details.resources), list(details.attributes)
+        )
+        self._uniq_id = uniq_id
+        self._ranges = ranges
+        self._fingerprints = list(ranges)
+        self._positions = {f: i for i, f in enumerate(self._fingerprints)}
+
+    def clear(self) -> None:
+        self._details = AutoLoadDetails([], [])
+        self._uniq_id = None
+        self._ranges = {}
+        self._fingerprints = []
+        self._positions = {}
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from threading import Event, Thread
-from typing import TypeVar
+from threading import Event, Lock, Thread
+from typing import TypeVar, Union
 
 from cloudshell.api.cloudshell_api import CloudShellAPISession, ResourceInfo
 
-from cloudshell.shell.standards.exceptions import BaseStandardException
+from cloudshell.shell.standards.core.autoload.existed_resource_stats import (
+    ExistedResourceInfoStats,
+)
+from cloudshell.shell.standards.core.autoload.resource_maps import (
+    CompactResourceMaps,
+    ResourceMaps,
+)
+from cloudshell.shell.standards.core.autoload.retry_policy import RetryPolicy
+from cloudshell.shell.standards.core.autoload.snapshot_store import (
+    ExistedResourceSnapshot,
+    ExistedResourceSnapshotStore,
+)
+from cloudshell.shell.standards.exceptions import (
+    BaseStandardException,
+    ExistedResourceInfoCancelled,
+    ExistedResourceInfoTimeout,
+)
 
 T = TypeVar("T")
+MAPS_TYPE = Union[ResourceMaps, CompactResourceMaps]
 
 
 def _wait_until_loaded(fn: T) -> T:
@@ -20,26 +41,189 @@ def _wait_until_loaded(fn: T) -> T:
     return wrapped
 
 
-class ExistedResourceInfo:
-    """Collects information about existed resource from the CloudShell.
+class BaseExistedResourceInfo:
+    """Base class for collecting information about existed resource.
 
     full_name it's a name of the resource with all parents names separated by "/"
         example: "Cisco/Chassis 1/Module 1/Port 1"
     address it's a relative address of the resource with all parents but
         without root address
         example: "CH1/M1/P1"
+    snapshot_store if set the maps are taken from the stored snapshot when the root
+        resource unique id and names and addresses of the sub resources are the
+        same, otherwise loaded maps are saved to it
+    compact_maps if True the maps are stored in CompactResourceMaps, it takes less
+        memory for the resources with a lot of sub resources but lookups are slower
+    stats_callback is called with the stats when the loading or refreshing is
+        finished, it shouldn't raise exceptions
     """
 
-    def __init__(self, name: str, api: CloudShellAPISession):
+    def __init__(
+        self,
+        name: str,
+        api: CloudShellAPISession,
+        snapshot_store: ExistedResourceSnapshotStore | None = None,
+        compact_maps: bool = False,
+        stats_callback: Callable[[ExistedResourceInfoStats], None] | None = None,
+    ):
         self.name = name
         self._api = api
+        self._stats = ExistedResourceInfoStats()
+        self._stats_callback = stats_callback
+        self._snapshot_store = snapshot_store
+        self._maps_cls = CompactResourceMaps if compact_maps else ResourceMaps
+        self._maps: MAPS_TYPE | None = None
+        self._uniq_id = None
+        self._full_name_to_uniq_id: Mapping[str, str] | None = None
+        self._uniq_id_to_full_name: Mapping[str, str] | None = None
+        self._full_name_to_address: Mapping[str, str] | None = None
+        self._address_to_full_name: Mapping[str, str] | None = None
+
+    @property
+    def stats(self) -> ExistedResourceInfoStats:
+        return self._stats
+
+    def _finish_stats(self, load_time: float) -> None:
+        self._stats.load_time = load_time
+        if self._maps is not None:
+            self._stats.full_names_count = len(self._full_name_to_address)
+            self._stats.uniq_ids_count = len(self._full_name_to_uniq_id)
+        if self._stats_callback:
+            self._stats_callback(self._stats)
+
+    def _init_maps(self) -> None:
+        self._set_maps(self._maps_cls())
+
+    def _set_maps(self, maps: MAPS_TYPE) -> None:
+        self._maps = maps
+        self._full_name_to_uniq_id = self._maps.full_name_to_uniq_id
+        self._uniq_id_to_full_name = self._maps.uniq_id_to_full_name
+        self._full_name_to_address = self._maps.full_name_to_address
+        self._address_to_full_name = self._maps.address_to_full_name
+
+    def _create_snapshot(self) -> ExistedResourceSnapshot:
+        return ExistedResourceSnapshot(
+            uniq_id=self._uniq_id,
+            full_name_to_uniq_id=dict(self._full_name_to_uniq_id),
+            full_name_to_address=dict(self._full_name_to_address),
+        )
+
+    def _set_snapshot(self, snapshot: ExistedResourceSnapshot) -> None:
+        self._init_maps()
+        for full_name, uniq_id in snapshot.full_name_to_uniq_id.items():
+            self._maps.add_uniq_id(full_name, uniq_id)
+        for full_name, address in snapshot.full_name_to_address.items():
+            self._maps.add_address(full_name, address)
+
+    def _load_stored_snapshot(self, root_info: ResourceInfo) -> bool:
+        """Set root unique id and maps from the snapshot store if it's valid.
+
+        The snapshot is valid if the root unique id is the same and names and
+        addresses of the sub resources in the root resource details are the same.
+        """
+        self._uniq_id = root_info.UniqeIdentifier
+        if self._snapshot_store:
+            snapshot = self._snapshot_store.get(self.name, self._uniq_id)
+            if snapshot and snapshot.full_name_to_address == dict(
+                _iter_children_addresses(root_info)
+            ):
+                self._set_snapshot(snapshot)
+                return True
+
+        self._init_maps()
+        return False
+
+    def _save_snapshot(self) -> None:
+        if self._snapshot_store:
+            self._snapshot_store.save(self.name, self._create_snapshot())
+
+    def _build_maps_for_resource(
+        self,
+        r_info: ResourceInfo,
+        addresses: bool = True,
+        uniq_ids: bool = True,
+        maps: MAPS_TYPE | None = None,
+    ) -> None:
+        if maps is None:
+            maps = self._maps
+        if uniq_ids:
+            maps.add_uniq_id(r_info.Name, r_info.UniqeIdentifier)
+        if addresses:
+            maps.add_address(r_info.Name, _get_address(r_info))
+        for child_info in r_info.ChildResources:
+            self._build_maps_for_resource(child_info, addresses, uniq_ids, maps)
+
+
+def _get_address(r_info: ResourceInfo) -> str:
+    # CS returns full address with root address - 192.168.1.3/chassis1/module1
+    return r_info.FullAddress.split("/", 1)[-1]
+
+
+def _iter_addresses(r_info: ResourceInfo) -> Iterator[tuple[str, str]]:
+    """Yield full names and addresses of the resource and its children."""
+    yield r_info.Name, _get_address(r_info)
+    for child_info in r_info.ChildResources:
+        yield from _iter_addresses(child_info)
+
+
+def _iter_children_addresses(r_info: ResourceInfo) -> Iterator[tuple[str, str]]:
+    """Yield full names and addresses of all sub resources of the resource."""
+    for child_info in r_info.ChildResources:
+        yield from _iter_addresses(child_info)
+
+
+def _get_root_child_name(full_name: str) -> str:
+    # full name of the root child is "root name/child name"
+    return "/".join(full_name.split("/", 2)[:2])
+
+
+class ExistedResourceInfo(BaseExistedResourceInfo):
+    """Collects information about existed resource from the CloudShell.
+
+    Data is loaded in the background daemon thread, lookups wait until it's loaded
+    and re-raise an error of the loading.
+
+    max_workers it's a number of threads used to load children of the root resource,
+        by default children are loaded one by one
+    lazy_uniq_ids if True names and addresses are taken from the single root
+        resource details and unique ids of the root children subtrees are loaded
+        only when they are requested
+    load_timeout it's a time budget in seconds for the whole loading, when it's
+        exceeded the loading fails with ExistedResourceInfoTimeout
+    retry_policy if set failed GetResourceDetails calls are retried with it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        api: CloudShellAPISession,
+        max_workers: int = 1,
+        lazy_uniq_ids: bool = False,
+        snapshot_store: ExistedResourceSnapshotStore | None = None,
+        load_timeout: float | None = None,
+        compact_maps: bool = False,
+        stats_callback: Callable[[ExistedResourceInfoStats], None] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        if max_workers < 1:
+            raise BaseStandardException("max_workers should be greater than 0")
+        super().__init__(name, api, snapshot_store, compact_maps, stats_callback)
+        self._max_workers = max_workers
+        self._retry_policy = retry_policy
+        self._lazy_uniq_ids = lazy_uniq_ids
+        self._uniq_ids_lock = Lock()
+        # names of the root children which unique ids are not loaded yet
+        self._not_loaded_children: dict[str, None] = {}
         self._started = Event()
         self._loaded = Event()
-        self._uniq_id = None
-        self._full_name_to_uniq_id: dict[str, str] | None = None
-        self._uniq_id_to_full_name: dict[str, str] | None = None
-        self._full_name_to_address: dict[str, str] | None = None
-        self._address_to_full_name: dict[str, str] | None = None
+        self._cancelled = Event()
+        self._finish_lock = Lock()
+        self._error: BaseException | None = None
+        self._load_timeout = load_timeout
+        self._deadline: float | None = None
+        # the initial loading is in progress even if the waiters are released
+        # by the timeout, the deadline is checked while it's True
+        self._loading = False
 
     @property
     @_wait_until_loaded
@@ -48,6 +232,8 @@ class ExistedResourceInfo:
 
     @_wait_until_loaded
     def get_uniq_id(self, full_name: str) -> str | None:
+        if self._not_loaded_children and full_name in self._full_name_to_address:
+            self._load_children_uniq_ids([_get_root_child_name(full_name)])
         return self._full_name_to_uniq_id.get(full_name)
 
     @_wait_until_loaded
@@ -66,40 +252,217 @@ class ExistedResourceInfo:
 
     @_wait_until_loaded
     def get_full_name_by_unique_id(self, unique_id: str) -> str | None:
+        if self._not_loaded_children and unique_id not in self._uniq_id_to_full_name:
+            self._load_children_uniq_ids(list(self._not_loaded_children))
         return self._uniq_id_to_full_name.get(unique_id)
 
+    @_wait_until_loaded
+    def get_full_names(self) -> list[str]:
+        """Return full names of all existed sub resources."""
+        return list(self._full_name_to_address)
+
     def load_data(self) -> None:
+        if self._started.is_set():
+            return
+        if self._load_timeout is not None:
+            self._deadline = time.monotonic() + self._load_timeout
         self._started.set()
-        Thread(target=self._load_data).start()
+        self._loading = True
+        Thread(
+            target=self._load_data_in_thread,
+            name=f"ExistedResourceInfo-{self.name}",
+            daemon=True,
+        ).start()
+
+    def wait_until_loaded(self, timeout: float | None = None) -> None:
+        """Wait until the data is loaded and re-raise an error of the loading.
 
-    def wait_until_loaded(self) -> None:
+        timeout limits the waiting of the caller only, the loading itself is
+        limited by load_timeout
+        """
         if not self._started.is_set():
             raise BaseStandardException("You have to start loading first")
-        self._loaded.wait()
+        if not self._loaded.is_set():
+            start = time.perf_counter()
+            try:
+                self._wait(timeout)
+            finally:
+                self._stats.add_wait_time(time.perf_counter() - start)
+
+        if self._error is not None:
+            raise self._error
+
+    def _wait(self, timeout: float | None) -> None:
+        if self._deadline is not None:
+            load_timeout = max(self._deadline - time.monotonic(), 0)
+        else:
+            load_timeout = None
+        if load_timeout is not None and (timeout is None or load_timeout <= timeout):
+            if not self._loaded.wait(load_timeout):
+                self._finish(self._get_load_timeout_error())
+        elif not self._loaded.wait(timeout):
+            raise ExistedResourceInfoTimeout(
+                f"Loading of the {self.name} isn't finished in {timeout} seconds"
+            )
+
+    @property
+    def is_loaded(self) -> bool:
+        """Loading is finished successfully or with an error."""
+        return self._loaded.is_set()
+
+    @property
+    def is_failed(self) -> bool:
+        return self._loaded.is_set() and self._error is not None
+
+    def cancel(self) -> None:
+        """Cancel the loading, waiters get ExistedResourceInfoCancelled."""
+        self._cancelled.set()
+        self._finish(self._get_cancelled_error())
+
+    def get_snapshot(self) -> ExistedResourceSnapshot:
+        """Return a snapshot of the loaded maps."""
+        self.wait_until_loaded()
+        self._load_children_uniq_ids(list(self._not_loaded_children))
+        return self._create_snapshot()
+
+    def refresh(self) -> None:
+        """Reload only changed subtrees of the root children.
+
+        Root resource details are compared with the loaded maps and a root child
+        subtree is reloaded only if names or addresses of its resources are changed
+        or they are added or removed. All subtrees are reloaded if the root
+        resource unique id is changed. The maps are replaced when the refresh is
+        finished, so lookups are not blocked.
+        """
+        self.wait_until_loaded()
+        start = time.perf_counter()
+        with self._uniq_ids_lock:
+            r_info = self._get_resource_details(self.name)
+            root_changed = r_info.UniqeIdentifier != self._uniq_id
+            old_addresses = self._full_name_to_address
+            old_uniq_ids = self._full_name_to_uniq_id
+            old_sizes = Counter(map(_get_root_child_name, old_addresses))
+            maps = self._maps_cls()
+            not_loaded_children = {}
+            changed_children = []
+
+            for child in r_info.ChildResources:
+                addresses = list(_iter_addresses(child))
+                changed = (
+                    root_changed
+                    or len(addresses) != old_sizes[child.Name]
+                    or any(old_addresses.get(n) != a for n, a in addresses)
+                )
+                if changed and not self._lazy_uniq_ids:
+                    changed_children.append(child.Name)
+                    continue
+
+                for full_name, address in addresses:
+                    maps.add_address(full_name, address)
+                if changed or child.Name in self._not_loaded_children:
+                    not_loaded_children[child.Name] = None
+                else:
+                    for full_name, _ in addresses:
+                        uniq_id = old_uniq_ids.get(full_name)
+                        if uniq_id is not None:
+                            maps.add_uniq_id(full_name, uniq_id)
+
+            for updated_child in self._get_resources_details(changed_children):
+                self._build_maps_for_resource(updated_child, maps=maps)
+
+            self._uniq_id = r_info.UniqeIdentifier
+            self._set_maps(maps)
+            self._not_loaded_children = not_loaded_children
+            if not not_loaded_children:
+                self._save_snapshot()
+        self._finish_stats(time.perf_counter() - start)
+
+    def _get_cancelled_error(self) -> ExistedResourceInfoCancelled:
+        return ExistedResourceInfoCancelled(f"Loading of the {self.name} is cancelled")
+
+    def _get_load_timeout_error(self) -> ExistedResourceInfoTimeout:
+        return ExistedResourceInfoTimeout(
+            f"Loading of the {self.name} isn't finished in {self._load_timeout} seconds"
+        )
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        """Mark loading as finished, only the first call has an effect."""
+        with self._finish_lock:
+            if not self._loaded.is_set():
+                self._error = error
+                self._loaded.set()
+
+    def _load_data_in_thread(self) -> None:
+        start = time.perf_counter()
+        error = None
+        try:
+            self._load_data()
+        except BaseException as e:
+            error = e
+        finally:
+            self._loading = False
+        try:
+            self._finish_stats(time.perf_counter() - start)
+        finally:
+            self._finish(error)
+
+    def _check_interrupted(self) -> None:
+        if self._cancelled.is_set():
+            raise self._get_cancelled_error()
+        deadline = self._deadline
+        if self._loading and deadline is not None and time.monotonic() > deadline:
+            raise self._get_load_timeout_error()
+
+    def _sleep_before_retry(self, delay: float) -> None:
+        if self._cancelled.wait(delay):
+            raise self._get_cancelled_error()
+        self._check_interrupted()
+
+    def _get_resource_details(self, name: str) -> ResourceInfo:
+        self._check_interrupted()
+        if self._retry_policy:
+            return self._retry_policy.call(
+                self._call_get_resource_details, name, sleep=self._sleep_before_retry
+            )
+        return self._call_get_resource_details(name)
+
+    def _call_get_resource_details(self, name: str) -> ResourceInfo:
+        start = time.perf_counter()
+        try:
+            return self._api.GetResourceDetails(name)
+        finally:
+            self._stats.add_api_call(time.perf_counter() - start)
 
     def _load_data(self):
-        r_info = self._api.GetResourceDetails(self.name)
-        self._uniq_id = r_info.UniqeIdentifier
-        self._full_name_to_uniq_id = {}
-        self._uniq_id_to_full_name = {}
-        self._full_name_to_address = {}
-        self._address_to_full_name = {}
-
-        for child in r_info.ChildResources:
-            # Root resource contains invalid uniq id for children but newly loaded child
-            # info contains valid uniq id for itself and its children
-            updated_child = self._api.GetResourceDetails(child.Name)
-            self._build_maps_for_resource(updated_child)
-
-        self._loaded.set()
-
-    def _build_maps_for_resource(self, r_info: ResourceInfo) -> None:
-        # CS returns full address with root address - 192.168.1.3/chassis1/module1
-        address = r_info.FullAddress.split("/", 1)[-1]
-
-        self._full_name_to_uniq_id[r_info.Name] = r_info.UniqeIdentifier
-        self._uniq_id_to_full_name[r_info.UniqeIdentifier] = r_info.Name
-        self._full_name_to_address[r_info.Name] = address
-        self._address_to_full_name[address] = r_info.Name
-        for child_info in r_info.ChildResources:
-            self._build_maps_for_resource(child_info)
+        r_info = self._get_resource_details(self.name)
+        if self._load_stored_snapshot(r_info):
+            return
+
+        # Root resource contains invalid uniq id for children but newly loaded child
+        # info contains valid uniq id for itself and its children
+        children_names = [child.Name for child in r_info.ChildResources]
+        if self._lazy_uniq_ids:
+            for child in r_info.ChildResources:
+                self._build_maps_for_resource(child, uniq_ids=False)
+            self._not_loaded_children = dict.fromkeys(children_names)
+        else:
+            for updated_child in self._get_resources_details(children_names):
+                self._build_maps_for_resource(updated_child)
+            self._save_snapshot()
+
+    def _load_children_uniq_ids(self, children_names: list[str]) -> None:
+        with self._uniq_ids_lock:
+            names = [n for n in children_names if n in self._not_loaded_children]
+            for updated_child in self._get_resources_details(names):
+                self._build_maps_for_resource(updated_child, addresses=False)
+            for name in names:
+                self._not_loaded_children.pop(name)
+
+    def _get_resources_details(self, names: list[str]) -> Iterable[ResourceInfo]:
+        """Load resources details keeping the order of the names."""
+        workers = min(self._max_workers, len(names))
+        if workers < 2:
+            return map(self._get_resource_details, names)
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(self._get_resource_details, names))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any
+
+from attrs import define
+
+from cloudshell.api.cloudshell_api import CloudShellAPISession
+
+from cloudshell.shell.standards.core.autoload.existed_resource_info import (
+    ExistedResourceInfo,
+)
+from cloudshell.shell.standards.exceptions import BaseStandardException
+
+
+class _SharedExistedResourceInfo(ExistedResourceInfo):
+    """Existed resource info shared by the registry, it can't be changed."""
+
+    def cancel(self) -> None:
+        raise BaseStandardException(
+            f"Shared existed resource info of the {self.name} can't be cancelled"
+        )
+
+    def refresh(self) -> None:
+        raise BaseStandardException(
+            f"Shared existed resource info of the {self.name} can't be refreshed, "
+            f"invalidate it in the registry to load it again"
+        )
+
+
+@define
+class _Entry:
+    info: ExistedResourceInfo
+    started: float
+    settings: dict[str, Any]
+
+
+class ExistedResourceInfoRegistry:
+    """Shares loading of the existed resources in the process.
+
+    Concurrent calls of get for the same resource name return the same
+    ExistedResourceInfo, so the resource is loaded once and all callers share one
+    copy of its maps. Loaded info is reused for freshness seconds from the start of
+    the loading, failed loadings are not reused. Expired entries are removed on
+    every get, so the registry keeps only fresh or loading resources. Shared info
+    is read-only, its cancel and refresh raise BaseStandardException.
+    """
+
+    def __init__(self, freshness: float = 30):
+        self._freshness = freshness
+        self._lock = Lock()
+        self._entries: dict[str, _Entry] = {}
+
+    def get(
+        self, name: str, api: CloudShellAPISession, **kwargs: Any
+    ) -> ExistedResourceInfo:
+        """Return started ExistedResourceInfo for the resource.
+
+        kwargs are passed to ExistedResourceInfo if it needs to be created, if the
+        shared info is created with other kwargs BaseStandardException is raised
+        """
+        with self._lock:
+            self._remove_expired()
+            entry = self._entries.get(name)
+            if entry is None:
+                info = _SharedExistedResourceInfo(name, api, **kwargs)
+                info.load_data()
+                entry = _Entry(info, time.monotonic(), kwargs)
+                self._entries[name] = entry
+            elif entry.settings != kwargs:
+                raise BaseStandardException(
+                    f"Existed resource info of the {name} is shared with other "
+                    f"settings {entry.settings}, invalidate it to use {kwargs}"
+                )
+            return entry.info
+
+    def invalidate(self, name: str) -> None:
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remove_expired(self) -> None:
+        expired = [n for n, e in self._entries.items() if self._is_expired(e)]
+        for name in expired:
+            del self._entries[name]
+
+    def _is_expired(self, entry: _Entry) -> bool:
+        # in-flight loading is always shared
+        if not entry.info.is_loaded:
+            return False
+        age = time.monotonic() - entry.started
+        return entry.info.is_failed or age >= self._freshness
+
+
+EXISTED_RESOURCE_INFO_REGISTRY = ExistedResourceInfoRegistry()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from attrs import define, field
+
+
+@define
+class ExistedResourceInfoStats:
+    """Statistics of the existed resource loading.
+
+    api_call_times it's a duration of every GetResourceDetails call in seconds
+    load_time it's a duration of the last loading or refreshing
+    wait_time it's a total time callers were blocked waiting for the loading
+    full_names_count and uniq_ids_count are sizes of the maps after the loading
+    """
+
+    api_calls: int = 0
+    api_call_times: list[float] = field(factory=list)
+    load_time: float | None = None
+    wait_time: float = 0
+    full_names_count: int = 0
+    uniq_ids_count: int = 0
+    _lock: Lock = field(factory=Lock, eq=False, repr=False)
+
+    @property
+    def api_time(self) -> float:
+        return sum(self.api_call_times)
+
+    def add_api_call(self, duration: float) -> None:
+        with self._lock:
+            self.api_calls += 1
+            self.api_call_times.append(duration)
+
+    def add_wait_time(self, duration: float) -> None:
+        with self._lock:
+            self.wait_time += duration
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping
+
+PATH_SEPARATOR = "/"
+_NOT_SET = -1
+
+
+class ResourceMaps:
+    """Maps of the existed resource stored in dicts.
+
+    full_name_to_uniq_id, uniq_id_to_full_name, full_name_to_address and
+    address_to_full_name are filled by add_uniq_id and add_address.
+    """
+
+    def __init__(self):
+        self.full_name_to_uniq_id: dict[str, str] = {}
+        self.uniq_id_to_full_name: dict[str, str] = {}
+        self.full_name_to_address: dict[str, str] = {}
+        self.address_to_full_name: dict[str, str] = {}
+
+    def add_uniq_id(self, full_name: str, uniq_id: str) -> None:
+        self.full_name_to_uniq_id[full_name] = uniq_id
+        self.uniq_id_to_full_name[uniq_id] = full_name
+
+    def add_address(self, full_name: str, address: str) -> None:
+        self.full_name_to_address[full_name] = address
+        self.address_to_full_name[address] = full_name
+
+
+class _PathTree:
+    """Paths separated by "/" stored as nodes with a parent and a name segment.
+
+    Common parts of the paths are stored once, if intern is True equal segments in
+    different branches are stored once too. Only nodes with children have dicts of
+    children.
+    """
+
+    def __init__(self, intern: bool):
+        self._interned: dict[str, str] | None = {} if intern else None
+        self._parents = array("i")
+        self._segments: list[str] = []
+        self._children: dict[int, dict[str, int]] = {}
+        self._roots: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def find(self, path: str) -> int | None:
+        children = self._roots
+        node = None
+        for segment in path.split(PATH_SEPARATOR):
+            if not children:
+                return None
+            node = children.get(segment)
+            if node is None:
+                return None
+            children = self._children.get(node)
+        return node
+
+    def add(self, path: str) -> int:
+        """Return the node of the path, creates missed nodes."""
+        children = self._roots
+        node = _NOT_SET
+        for segment in path.split(PATH_SEPARATOR):
+            if children is None:
+                children = self._children[node] = {}
+            child = children.get(segment)
+            if child is None:
+                child = len(self._parents)
+                if self._interned is not None:
+                    segment = self._interned.setdefault(segment, segment)
+                self._parents.append(node)
+                self._segments.append(segment)
+                children[segment] = child
+            node = child
+            children = self._children.get(node)
+        return node
+
+    def get_path(self, node: int) -> str:
+        segments = []
+        while node != _NOT_SET:
+            segments.append(self._segments[node])
+            node = self._parents[node]
+        return PATH_SEPARATOR.join(reversed(segments))
+
+
+class _PackedStrings:
+    """List of optional strings packed in one buffer."""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._starts = array("i")
+        self._ends = array("i")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, i: int) -> str | None:
+        start = self._starts[i]
+        if start == _NOT_SET:
+            return None
+        return self._data[start : self._ends[i]].decode()
+
+    def __setitem__(self, i: int, value: str) -> None:
+        # a replaced value is left in the buffer, values are rarely replaced
+        self._starts[i] = len(self._data)
+        self._data += value.encode()
+        self._ends[i] = len(self._data)
+
+    def is_set(self, i: int) -> bool:
+        return self._starts[i] != _NOT_SET
+
+    def extend_empty(self, count: int) -> None:
+        self._starts.extend([_NOT_SET] * count)
+        self._ends.extend([_NOT_SET] * count)
+
+    def items(self) -> Iterator[tuple[int, str]]:
+        for i in range(len(self._starts)):
+            if self.is_set(i):
+                yield i, self[i]
+
+
+class _MapView(Mapping):
+    def __init__(self, maps: CompactResourceMaps):
+        self._maps = maps
+
+
+class _FullNameToUniqIdView(_MapView):
+    def __getitem__(self, full_name: str) -> str:
+        node = self._maps._names.find(full_name)
+        if node is None or not self._maps._uniq_ids.is_set(node):
+            raise KeyError(full_name)
+        return self._maps._uniq_ids[node]
+
+    def __iter__(self) -> Iterator[str]:
+        for node, _ in self._maps._uniq_ids.items():
+            yield self._maps._names.get_path(node)
+
+    def __len__(self) -> int:
+        return self._maps._uniq_ids_count
+
+
+class _UniqIdToFullNameView(_MapView):
+    def __getitem__(self, uniq_id: str) -> str:
+        node = self._maps._get_uniq_id_index()[uniq_id]
+        return self._maps._names.get_path(node)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._maps._get_uniq_id_index())
+
+    def __len__(self) -> int:
+        return len(self._maps._get_uniq_id_index())
+
+
+class _FullNameToAddressView(_MapView):
+    def __getitem__(self, full_name: str) -> str:
+        node = self._maps._names.find(full_name)
+        if node is None or self._maps._name_to_address[node] == _NOT_SET:
+            raise KeyError(full_name)
+        return self._maps._addresses.get_path(self._maps._name_to_address[node])
+
+    def __iter__(self) -> Iterator[str]:
+        for node, address_node in enumerate(self._maps._name_to_address):
+            if address_node != _NOT_SET:
+                yield self._maps._names.get_path(node)
+
+    def __len__(self) -> int:
+        return self._maps._addresses_count
+
+
+class _AddressToFullNameView(_MapView):
+    def __getitem__(self, address: str) -> str:
+        node = self._maps._addresses.find(address)
+        if node is None or self._maps._address_to_name[node] == _NOT_SET:
+            raise KeyError(address)
+        return self._maps._names.get_path(self._maps._address_to_name[node])
+
+    def __iter__(self) -> Iterator[str]:
+        for node, name_node in enumerate(self._maps._address_to_name):
+            if name_node != _NOT_SET:
+                yield self._maps._addresses.get_path(node)
+
+    def __len__(self) -> int:
+        return self._maps._address_names_count
+
+
+class CompactResourceMaps:
+    """Maps of the existed resource stored in trees of interned path segments.
+
+    Full names and addresses are not stored as strings, they are built on demand,
+    unique ids are packed in one buffer. It takes less memory for big resources
+    but every lookup costs O(depth).
+    The maps are read-only Mapping views. The uniq_id_to_full_name index is built
+    on the first access to it.
+    """
+
+    def __init__(self):
+        # names of the ports are usually unique but their addresses - P1, P2, ...
+        # are repeated in every module
+        self._names = _PathTree(intern=False)
+        self._addresses = _PathTree(intern=True)
+        # indexed by names nodes
+        self._uniq_ids = _PackedStrings()
+        self._name_to_address = array("i")
+        # indexed by addresses nodes
+        self._address_to_name = array("i")
+        self._uniq_id_index: dict[str, int] | None = None
+        self._uniq_ids_count = 0
+        self._addresses_count = 0
+        self._address_names_count = 0
+
+        self.full_name_to_uniq_id = _FullNameToUniqIdView(self)
+        self.uniq_id_to_full_name = _UniqIdToFullNameView(self)
+        self.full_name_to_address = _FullNameToAddressView(self)
+        self.address_to_full_name = _AddressToFullNameView(self)
+
+    def add_uniq_id(self, full_name: str, uniq_id: str) -> None:
+        node = self._add_name(full_name)
+        if not self._uniq_ids.is_set(node):
+            self._uniq_ids_count += 1
+        self._uniq_ids[node] = uniq_id
+        if self._uniq_id_index is not None:
+            self._uniq_id_index[uniq_id] = node
+
+    def add_address(self, full_name: str, address: str) -> None:
+        node = self._add_name(full_name)
+        address_node = self._addresses.add(address)
+        missed = len(self._addresses) - len(self._address_to_name)
+        self._address_to_name.extend([_NOT_SET] * missed)
+
+        if self._name_to_address[node] == _NOT_SET:
+            self._addresses_count += 1
+        if self._address_to_name[address_node] == _NOT_SET:
+            self._address_names_count += 1
+        self._name_to_address[node] = address_node
+        self._address_to_name[address_node] = node
+
+    def _add_name(self, full_name: str) -> int:
+        node = self._names.add(full_name)
+        missed = len(self._names) - len(self._uniq_ids)
+        if missed:
+            self._uniq_ids.extend_empty(missed)
+            self._name_to_address.extend([_NOT_SET] * missed)
+        return node
+
+    def _get_uniq_id_index(self) -> dict[str, int]:
+        if self._uniq_id_index is None:
+            self._uniq_id_index = {
+                uniq_id: node for node, uniq_id in self._uniq_ids.items()
+            }
+        return self._uniq_id_index
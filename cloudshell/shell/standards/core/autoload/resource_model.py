@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, TypeVar
 
 from cloudshell.shell.standards.core.autoload.core_entities import (
@@ -11,14 +13,35 @@ from cloudshell.shell.standards.core.autoload.core_entities import (
     RelativeAddress,
 )
 from cloudshell.shell.standards.core.namespace_type import NameSpaceType
-from cloudshell.shell.standards.core.utils import validate_str_for_cs
+from cloudshell.shell.standards.core.utils import get_str_hash, validate_str_for_cs
 from cloudshell.shell.standards.exceptions import ResourceModelException
 
 SUB_RESOURCE_TYPE = TypeVar("SUB_RESOURCE_TYPE", bound="ResourceNode")
 
 
+class _NameAttribute(InstanceAttribute):
+    """Name of the resource, cached names are invalidated on its change."""
+
+    def __set__(self, instance, value):
+        super().__set__(instance, value)
+        instance.relative_address._invalidate_tree()
+
+
 class ResourceNode(ABC):
-    _name = InstanceAttribute()
+    # slots are defined in the subclasses, only one of the bases of
+    # AbstractResource can have them
+    __slots__ = ()
+    _SLOTS = (
+        "relative_address",
+        "_cached_names",
+        "_cache_version",
+        "_parent",
+        "_child_resources",
+        "_name_value",
+        "_unique_identifier_value",
+    )
+
+    _name = _NameAttribute()
     _unique_identifier = InstanceAttribute()
 
     def __init__(
@@ -29,18 +52,27 @@ class ResourceNode(ABC):
         unique_id: str | None = None,
     ):
         self.relative_address = RelativeAddress(index, prefix)
+        self._cached_names: tuple[str, str] | None = None
+        self._cache_version = -1
 
         self.parent = None
         self._name = name
         self._unique_identifier = unique_id
-        self._child_resources: list[SUB_RESOURCE_TYPE] = []
+        # created on adding of the first child
+        self._child_resources: list[SUB_RESOURCE_TYPE] | tuple = ()
+
+    @property
+    def parent(self) -> ResourceNode | None:
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: ResourceNode | None) -> None:
+        self._parent = value
+        self.relative_address._invalidate_tree()
 
     @property
     def name(self) -> str:
-        if self._name:
-            return self._name
-        else:
-            return self._gen_name()
+        return self._get_cached_names()[0]
 
     @property
     def full_name(self) -> str:
@@ -48,9 +80,24 @@ class ResourceNode(ABC):
 
         Example: "Cisco/Chassis 1/Module 1/Port 1"
         """
-        if self.parent:
-            return f"{self.parent.full_name}/{self.name}"
-        return self.name
+        return self._get_cached_names()[1]
+
+    def _get_cached_names(self) -> tuple[str, str]:
+        """Return the name and the full name, they are built once per version.
+
+        The version is the version of the tree of the relative addresses, the
+        resources are linked to the parents together with their addresses.
+        """
+        version = self.relative_address._get_tree_version()
+        if self._cache_version != version:
+            name = self._name or self._gen_name()
+            if self.parent:
+                full_name = f"{self.parent.full_name}/{name}"
+            else:
+                full_name = name
+            self._cached_names = name, full_name
+            self._cache_version = version
+        return self._cached_names
 
     @abstractmethod
     def _gen_name(self) -> str:
@@ -59,23 +106,47 @@ class ResourceNode(ABC):
 
     @property
     def unique_identifier(self) -> str:
+        return self.get_unique_identifier()
+
+    def get_unique_identifier(self, legacy: bool = False) -> str:
+        """Return the unique id, the generated one is stable between processes.
+
+        legacy it's for ids generated with the built-in hash() as before
+        """
         if self._unique_identifier:
             return self._unique_identifier
-        return self._gen_unique_id()
+        return self._gen_unique_id(legacy)
 
-    def _gen_unique_id(self) -> str:
-        return str(hash(f"{self.relative_address}+{self.name}"))
+    def _gen_unique_id(self, legacy: bool = False) -> str:
+        return get_str_hash(f"{self.relative_address}+{self.name}", legacy)
 
     def _add_sub_resource(self, sub_resource: SUB_RESOURCE_TYPE) -> None:
         sub_resource.relative_address.parent_node = self.relative_address
         sub_resource.parent = self
+        if not self._child_resources:
+            self._child_resources = []
         self._child_resources.append(sub_resource)
 
+    def _add_sub_resources(self, sub_resources: list[SUB_RESOURCE_TYPE]) -> None:
+        """Add sub resources in one pass.
+
+        The parent is set without the version change, it's changed by the linking
+        of the relative address.
+        """
+        address = self.relative_address
+        for sub_resource in sub_resources:
+            sub_resource.relative_address.parent_node = address
+            sub_resource._parent = self
+        if not self._child_resources:
+            self._child_resources = []
+        self._child_resources.extend(sub_resources)
+
     def extract_sub_resources(self) -> tuple[SUB_RESOURCE_TYPE, ...]:
         return tuple(self._child_resources)
 
 
 class NamespaceAttributeContainer(AttributeContainer):
+    __slots__ = ("family_name", "shell_name", "resource_model")
     _RESOURCE_MODEL = ""
 
     def __init__(
@@ -99,19 +170,39 @@ class ResourceAttribute(AttributeModel):
     ):
         super().__init__(name, default_value)
         self.namespace_attribute = namespace_attribute
+        self._namespace_attr_name = namespace_attribute.value
+        self._with_resource_model = namespace_attribute is NameSpaceType.SHELL_NAME
+        # namespace: resource model: attribute name
+        self._attribute_names: dict[str | None, dict[str | None, str]] = {}
 
     def attribute_name(self, instance: NamespaceAttributeContainer) -> str:
-        """Generate attribute name for the specified prefix."""
-        namespace = getattr(instance, self.namespace_attribute.value)
-        if self.namespace_attribute is NameSpaceType.SHELL_NAME and namespace:
+        """Generate attribute name for the specified prefix.
+
+        Names are cached for every namespace and resource model.
+        """
+        namespace = getattr(instance, self._namespace_attr_name)
+        if self._with_resource_model:
             resource_model = getattr(instance, self._RESOURCE_MODEL_ATTR)
-            if resource_model:
-                namespace = ".".join((namespace, resource_model))
+        else:
+            resource_model = None
+        try:
+            return self._attribute_names[namespace][resource_model]
+        except KeyError:
+            name = self._build_attribute_name(namespace, resource_model)
+            self._attribute_names.setdefault(namespace, {})[resource_model] = name
+            return name
 
+    def _build_attribute_name(
+        self, namespace: str | None, resource_model: str | None
+    ) -> str:
+        if self._with_resource_model and namespace and resource_model:
+            namespace = ".".join((namespace, resource_model))
         return ".".join((namespace, self.name)) if namespace else self.name
 
 
 class AbstractResource(ResourceNode, NamespaceAttributeContainer):
+    # subclasses without __slots__ get __dict__ and can have any attributes
+    __slots__ = (*ResourceNode._SLOTS, "__weakref__")
     _RELATIVE_ADDRESS_PREFIX = ""
     _NAME_TEMPLATE = ""
     _FAMILY_NAME = ""
@@ -158,6 +249,98 @@ class AbstractResource(ResourceNode, NamespaceAttributeContainer):
                 f"Class {sub_resource_cls_name} not allowed to connect to {cls_name}"
             )
 
+    def _connect_resources_from_columns(
+        self,
+        resource_cls: type[AbstractResource],
+        allowed_types: Iterable[type],
+        indexes: Sequence[Any],
+        names: Sequence[str | None] | None,
+        unique_ids: Sequence[str | None] | None,
+        attributes: Mapping[str, Sequence[Any]],
+    ) -> list[AbstractResource]:
+        """Create child resources from the columns of values and connect them.
+
+        Every column has a value for every resource, attributes are columns named
+        as the attributes of the resource class. The class and the columns are
+        validated once, attributes are set with AttributeModel.set_values.
+        """
+        if not issubclass(resource_cls, tuple(allowed_types)):
+            raise ResourceModelException(
+                f"Class {resource_cls.__name__} not allowed to connect to "
+                f"{type(self).__name__}"
+            )
+        count = len(indexes)
+        columns = {"names": names, "unique_ids": unique_ids, **attributes}
+        for column_name, column in columns.items():
+            if column is not None and len(column) != count:
+                raise ResourceModelException(
+                    f"Column {column_name} has {len(column)} values, "
+                    f"expected {count}"
+                )
+        models = []
+        for attr_name, column in attributes.items():
+            model = getattr(resource_cls, attr_name, None)
+            if not isinstance(model, AttributeModel):
+                raise ResourceModelException(
+                    f"Class {resource_cls.__name__} hasn't attribute {attr_name}"
+                )
+            models.append((model, column))
+
+        resources = [
+            resource_cls(str(index), name=name, unique_id=unique_id)
+            for index, name, unique_id in zip(
+                indexes,
+                itertools.repeat(None) if names is None else names,
+                itertools.repeat(None) if unique_ids is None else unique_ids,
+            )
+        ]
+        for model, column in models:
+            model.set_values(resources, column)
+        self._add_sub_resources(resources)
+        return resources
+
+    @property
+    def fingerprint(self) -> str:
+        """Content fingerprint of the resource and all its sub resources."""
+        return self.get_fingerprints()[id(self)]
+
+    def get_fingerprints(self) -> dict[int, str]:
+        """Return fingerprints of the resource and its sub resources by their ids.
+
+        A fingerprint combines the full name, the relative address, the model, the
+        unique id and the attributes of the resource with the fingerprints of its
+        children, so it's changed if anything in the subtree is changed.
+        """
+        fingerprints = {}
+        # children are None until the children of the resource are processed
+        stack: list[tuple[AbstractResource, tuple | None]] = [(self, None)]
+        while stack:
+            resource, children = stack.pop()
+            if children is None:
+                children = resource.extract_sub_resources()
+                stack.append((resource, children))
+                stack.extend((child, None) for child in children)
+                continue
+
+            digest = hashlib.blake2b(digest_size=16)
+            for part in resource._iter_fingerprint_parts():
+                digest.update(part.encode())
+                digest.update(b"\0")
+            for child in children:
+                digest.update(fingerprints[id(child)].encode())
+            fingerprints[id(resource)] = digest.hexdigest()
+        return fingerprints
+
+    def _iter_fingerprint_parts(self) -> Iterator[str]:
+        yield self.full_name
+        yield str(self.relative_address)
+        yield self.cloudshell_model_name
+        yield self._unique_identifier or ""
+        for name, value in self.attributes.items():
+            if value is not None:
+                yield str(name)
+                yield str(value)
+
     @property
     def cloudshell_model_name(self) -> str:
         """Return the name of the CloudShell model."""
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from threading import Lock, Thread
+from typing import Any, TypeVar
+
+from attrs import define, field, validators
+
+from cloudshell.api.common_cloudshell_api import CloudShellAPIError, UnauthorizedError
+
+from cloudshell.shell.standards.exceptions import CircuitBreakerOpen
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """Fails calls fast when the server is down.
+
+    The breaker opens after failure_threshold consecutive failures and rejects
+    calls with CircuitBreakerOpen for reset_timeout seconds. After that one trial
+    call is allowed, it closes the breaker on success or opens it again on failure.
+    Share one breaker between all users of the same server.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_call = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if (
+                self._trial_call
+                or time.monotonic() - self._opened_at < self._reset_timeout
+            ):
+                raise CircuitBreakerOpen(
+                    f"Circuit breaker is open after {self._failures} failures"
+                )
+            self._trial_call = True
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_call = False
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_call or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_call = False
+
+    def on_interrupted(self) -> None:
+        """The call is cancelled or interrupted, the trial call is allowed again."""
+        with self._lock:
+            self._trial_call = False
+
+
+@define(frozen=True)
+class RetryPolicy:
+    """Retries failed API calls with exponential backoff and jitter.
+
+    attempts it's a max number of attempts for one call
+    backoff it's a delay before the second attempt, it's doubled for every next
+        attempt up to max_backoff
+    jitter it's a fraction of the delay that is randomly subtracted from it
+    call_timeout limits every attempt, a timed out call is left in the background
+    retry_on are retried errors except no_retry_on, by default everything except
+        errors returned by the CloudShell API
+    circuit_breaker if set it's checked before every attempt
+    """
+
+    attempts: int = field(default=3, validator=validators.ge(1))
+    backoff: float = 0.5
+    max_backoff: float = 10
+    jitter: float = 0.5
+    call_timeout: float | None = None
+    retry_on: tuple[type[BaseException], ...] = (Exception,)
+    no_retry_on: tuple[type[BaseException], ...] = (
+        CloudShellAPIError,
+        UnauthorizedError,
+    )
+    circuit_breaker: CircuitBreaker | None = field(default=None, eq=False)
+
+    def get_delay(self, attempt: int) -> float:
+        """Delay after the failed attempt, attempts are counted from 1."""
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return delay * (1 - self.jitter * random.random())
+
+    def is_retriable(self, error: BaseException) -> bool:
+        """Cancelled calls are never retried."""
+        if isinstance(error, asyncio.CancelledError):
+            return False
+        return isinstance(error, self.retry_on) and not isinstance(
+            error, self.no_retry_on
+        )
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> T:
+        for attempt in range(1, self.attempts + 1):
+            if self.circuit_breaker:
+                self.circuit_breaker.before_call()
+            try:
+                result = _call_with_timeout(func, self.call_timeout, *args)
+            except Exception as e:
+                if not self._on_error(e, attempt):
+                    raise
+            except BaseException:
+                # cancelled or interrupted, e.g. CancelledError or KeyboardInterrupt
+                self._on_interrupted()
+                raise
+            else:
+                self._on_success()
+                return result
+            sleep(self.get_delay(attempt))
+
+    async def call_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+    ) -> T:
+        for attempt in range(1, self.attempts + 1):
+            if self.circuit_breaker:
+                self.circuit_breaker.before_call()
+            try:
+                result = await asyncio.wait_for(func(*args), self.call_timeout)
+            except asyncio.CancelledError:
+                # it's an Exception before Python 3.8
+                self._on_interrupted()
+                raise
+            except Exception as e:
+                if not self._on_error(e, attempt):
+                    raise
+            except BaseException:
+                # cancelled or interrupted, e.g. CancelledError or KeyboardInterrupt
+                self._on_interrupted()
+                raise
+            else:
+                self._on_success()
+                return result
+            await asyncio.sleep(self.get_delay(attempt))
+
+    def _on_success(self) -> None:
+        if self.circuit_breaker:
+            self.circuit_breaker.on_success()
+
+    def _on_interrupted(self) -> None:
+        if self.circuit_breaker:
+            self.circuit_breaker.on_interrupted()
+
+    def _on_error(self, error: Exception, attempt: int) -> bool:
+        """Register the error and return True if the call should be retried."""
+        retriable = self.is_retriable(error)
+        if self.circuit_breaker:
+            # the server responded if the error is not retriable
+            if retriable:
+                self.circuit_breaker.on_failure()
+            else:
+                self.circuit_breaker.on_success()
+        return retriable and attempt < self.attempts
+
+
+def _call_with_timeout(func: Callable[..., T], timeout: float | None, *args) -> T:
+    if timeout is None:
+        return func(*args)
+
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func(*args)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"The call isn't finished in {timeout} seconds")
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from attrs import define, field
+
+
+@define(frozen=True)
+class ExistedResourceSnapshot:
+    """Maps of the existed resource collected from the CloudShell.
+
+    Every map is keyed by the full name of the resource, reverse maps are built
+    from them.
+    """
+
+    uniq_id: str
+    full_name_to_uniq_id: dict[str, str]
+    full_name_to_address: dict[str, str]
+    created: float = field(factory=time.time)
+
+    @property
+    def uniq_id_to_full_name(self) -> dict[str, str]:
+        return {v: k for k, v in self.full_name_to_uniq_id.items()}
+
+    @property
+    def address_to_full_name(self) -> dict[str, str]:
+        return {v: k for k, v in self.full_name_to_address.items()}
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.created < ttl
+
+
+class ExistedResourceSnapshotStore:
+    """Keeps snapshots of the existed resources on the disk.
+
+    A snapshot is valid while the root resource has the same unique id and it's
+    not older than ttl seconds. ExistedResourceInfo also compares names and
+    addresses of the snapshot with the root resource details, other changes of
+    the sub resources, e.g. recreated ones, are not tracked, so a snapshot should
+    be invalidated after them.
+    Snapshots are stored as compact JSON files with full names, unique ids and
+    addresses as parallel lists.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str | Path, ttl: float = 300):
+        self._directory = Path(directory)
+        self._ttl = ttl
+
+    def _get_path(self, name: str) -> Path:
+        file_name = hashlib.sha1(name.encode()).hexdigest()
+        return self._directory / f"{file_name}.json"
+
+    def get(self, name: str, uniq_id: str) -> ExistedResourceSnapshot | None:
+        """Return a fresh snapshot of the resource or None."""
+        try:
+            with self._get_path(name).open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            snapshot = self._load_snapshot(data, name, uniq_id)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # valid JSON with a wrong structure
+            return None
+        if snapshot is None or not snapshot.is_fresh(self._ttl):
+            return None
+        return snapshot
+
+    def _load_snapshot(
+        self, data: dict, name: str, uniq_id: str
+    ) -> ExistedResourceSnapshot | None:
+        if (
+            data.get("version") != self.FORMAT_VERSION
+            or data.get("name") != name
+            or data.get("uniq_id") != uniq_id
+        ):
+            return None
+        names, uniq_ids, addresses = data["names"], data["uniq_ids"], data["addresses"]
+        if not len(names) == len(uniq_ids) == len(addresses):
+            return None
+        return ExistedResourceSnapshot(
+            uniq_id=uniq_id,
+            full_name_to_uniq_id={n: id_ for n, id_ in zip(names, uniq_ids) if id_},
+            full_name_to_address=dict(zip(names, addresses)),
+            created=float(data["created"]),
+        )
+
+    def save(self, name: str, snapshot: ExistedResourceSnapshot) -> None:
+        names = list(snapshot.full_name_to_address)
+        data = {
+            "version": self.FORMAT_VERSION,
+            "name": name,
+            "uniq_id": snapshot.uniq_id,
+            "created": snapshot.created,
+            "names": names,
+            "uniq_ids": [snapshot.full_name_to_uniq_id.get(n) for n in names],
+            "addresses": [snapshot.full_name_to_address[n] for n in names],
+        }
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # write to the temp file and replace to not leave a broken snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self._get_path(name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def invalidate(self, name: str) -> None:
+        try:
+            self._get_path(name).unlink()
+        except FileNotFoundError:
+            pass
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from cloudshell.shell.core.driver_context import (
@@ -8,12 +10,19 @@ from cloudshell.shell.core.driver_context import (
     AutoLoadResource,
 )
 
+from cloudshell.shell.standards.core.autoload.autoload_delta import AutoloadDelta
 from cloudshell.shell.standards.core.autoload.existed_resource_info import (
     ExistedResourceInfo,
 )
+from cloudshell.shell.standards.core.utils import get_str_hash
+from cloudshell.shell.standards.exceptions import BaseStandardException
 
 if TYPE_CHECKING:
     from cloudshell.shell.standards.autoload_generic_models import GenericResourceModel
+    from cloudshell.shell.standards.core.autoload.details_cache import (
+        RANGE_TYPE,
+        AutoloadDetailsCache,
+    )
     from cloudshell.shell.standards.core.autoload.resource_model import AbstractResource
 
 
@@ -22,61 +31,278 @@ class AutoloadDetailsBuilder:
         self,
         resource_model: GenericResourceModel,
         existed_resource_info: ExistedResourceInfo,
+        legacy_unique_ids: bool = False,
+        details_cache: AutoloadDetailsCache | None = None,
     ):
+        """Builds AutoLoadDetails from the resource model.
+
+        legacy_unique_ids it's for unique ids generated with the built-in hash()
+            which are different in every process, by default generated ids are
+            stable and the same device gets the same ids on every autoload
+        details_cache if set build_details reuses the output of the subtrees not
+            changed since the last build and stores the new output in it
+        """
         self._resource_model = resource_model
         self._existed_resource_info = existed_resource_info
+        self._legacy_unique_ids = legacy_unique_ids
+        self._details_cache = details_cache
         self._updated_rel_path_map = {}
+        # addresses generated by the builder and next suffixes to try for them
+        self._uniq_addr_map: dict[str, str] = {}
+        self._used_addresses: set[str] = set()
+        self._next_addr_suffix: dict[str, int] = {}
+
+    def _iter_branch(self, resource: AbstractResource) -> Iterator[AbstractResource]:
+        """Iterate over the resource and its sub resources depth-first.
+
+        Uses an explicit stack, the order is the same as for the recursive walk,
+        modules without children are skipped.
+        """
+        branch_children = get_branch_children(resource)
+        stack = [resource]
+        while stack:
+            resource = stack.pop()
+            yield resource
+            stack.extend(reversed(branch_children.get(id(resource), ())))
 
     def _build_branch(self, resource: AbstractResource) -> AutoLoadDetails:
-        resource.shell_name = resource.shell_name or self._resource_model.shell_name
-        autoload_details = AutoLoadDetails(
-            self._get_autoload_resources(resource),
-            self._get_autoload_attributes(resource),
-        )
+        resources = []
+        attributes = []
+        for sub_resource in self._iter_branch(resource):
+            self._add_autoload_details(sub_resource, resources, attributes)
+        return AutoLoadDetails(resources, attributes)
 
-        for child_resource in resource.extract_sub_resources():
-            if not is_module_without_children(child_resource):
-                child_details = self._build_branch(child_resource)
-                autoload_details.resources.extend(child_details.resources)
-                autoload_details.attributes.extend(child_details.attributes)
-        return autoload_details
+    def _build_branch_with_cache(self, resource: AbstractResource) -> AutoLoadDetails:
+        """Build the details reusing the output of the not changed subtrees."""
+        branch_children = get_branch_children(resource)
+        for sub_resource in self._iter_branch(resource):
+            # fingerprints include the model names and the attribute names
+            sub_resource.shell_name = (
+                sub_resource.shell_name or self._resource_model.shell_name
+            )
+        fingerprints = resource.get_fingerprints()
+        uniq_id = self._existed_resource_info.uniq_id
+        resources = []
+        attributes = []
+        # subtrees are added in post-order when all their sub resources are added
+        ranges = {}
+        stack: list[tuple[AbstractResource, tuple | None]] = [(resource, None)]
+        while stack:
+            resource, subtree_start = stack.pop()
+            fingerprint = fingerprints[id(resource)]
+            if subtree_start is None:
+                address = self._get_relative_address(resource)
+                if self._reuse_details(
+                    fingerprint, address, uniq_id, resources, attributes, ranges
+                ):
+                    continue
+                subtree_start = address, len(resources), len(attributes), len(ranges)
+                self._add_autoload_details(resource, resources, attributes)
+                stack.append((resource, subtree_start))
+                children = branch_children.get(id(resource), ())
+                stack.extend((child, None) for child in reversed(children))
+                continue
+
+            address, r_start, a_start, ranges_start = subtree_start
+            ranges[fingerprint] = (
+                address,
+                r_start,
+                len(resources),
+                a_start,
+                len(attributes),
+                len(ranges) - ranges_start + 1,
+            )
+        details = AutoLoadDetails(resources, attributes)
+        self._details_cache.update(details, ranges, uniq_id)
+        return details
+
+    def _reuse_details(
+        self,
+        fingerprint: str,
+        relative_address: str,
+        uniq_id: str,
+        resources: list[AutoLoadResource],
+        attributes: list[AutoLoadAttribute],
+        ranges: dict[str, RANGE_TYPE],
+    ) -> bool:
+        """Add the cached details and ranges of the subtree if it's not changed."""
+        cached = self._details_cache.get(fingerprint, relative_address, uniq_id)
+        if cached is None:
+            return False
+        details, subtree_ranges = cached
+        r_start, a_start = len(resources), len(attributes)
+        for resource in details.resources:
+            # reused addresses can't be generated for the new resources
+            self._used_addresses.add(resource.relative_address)
+        resources.extend(details.resources)
+        attributes.extend(details.attributes)
+        # ranges of the sub subtrees are kept for the next builds
+        for sub_fingerprint, range_ in subtree_ranges.items():
+            address, sub_r_start, sub_r_end, sub_a_start, sub_a_end, size = range_
+            ranges[sub_fingerprint] = (
+                address,
+                sub_r_start + r_start,
+                sub_r_end + r_start,
+                sub_a_start + a_start,
+                sub_a_end + a_start,
+                size,
+            )
+        return True
 
     def build_details(self) -> AutoLoadDetails:
+        if self._details_cache is not None:
+            return self._build_branch_with_cache(self._resource_model)
         return self._build_branch(self._resource_model)
 
-    def _get_autoload_resources(
-        self, resource: AbstractResource
-    ) -> list[AutoLoadResource]:
+    def build_details_delta(
+        self, previous: AutoLoadDetails | None = None, include_orphans: bool = False
+    ) -> AutoloadDelta:
+        """Build autoload details only for the new and changed resources.
+
+        Resources which are not in the existed resource info are new. Existed
+        resources are compared with the previous details, e.g. details of the last
+        autoload, a resource is changed if its model, name or unique id is changed
+        or any of its attributes. Without previous details all existed resources
+        are changed.
+        include_orphans collects existed resources which are not discovered
+        """
+        ex_res = self._existed_resource_info
+        previous = previous or AutoLoadDetails([], [])
+        previous_resources = {r.relative_address: r for r in previous.resources}
+        previous_attributes = defaultdict(dict)
+        for attribute in previous.attributes:
+            previous_attributes[attribute.relative_address][
+                attribute.attribute_name
+            ] = attribute.attribute_value
+
+        delta = AutoloadDelta(AutoLoadDetails([], []))
+        discovered = set()
+        for resource in self._iter_branch(self._resource_model):
+            resources = []
+            attributes = []
+            self._add_autoload_details(resource, resources, attributes)
+            full_name = resource.full_name
+            discovered.add(full_name)
+            if resource is not self._resource_model and (
+                ex_res.get_address(full_name) is None
+            ):
+                delta.new.append(full_name)
+            else:
+                address = self._get_relative_address(resource)
+                changed_attributes = [
+                    a
+                    for a in attributes
+                    if previous_attributes[address].get(a.attribute_name)
+                    != a.attribute_value
+                ]
+                previous_resource = previous_resources.get(address)
+                if not changed_attributes and (
+                    not resources
+                    or previous_resource
+                    and vars(previous_resource) == vars(resources[0])
+                ):
+                    delta.unchanged.append(full_name)
+                    continue
+                delta.changed.append(full_name)
+                attributes = changed_attributes
+            delta.details.resources.extend(resources)
+            delta.details.attributes.extend(attributes)
+
+        if include_orphans:
+            delta.orphans = [
+                name for name in ex_res.get_full_names() if name not in discovered
+            ]
+        return delta
+
+    def build_details_iter(self, chunk_size: int = 1000) -> Iterator[AutoLoadDetails]:
+        """Yield autoload details in chunks while walking the resource tree.
+
+        chunk_size it's a number of resources and attributes in a chunk, a chunk is
+            yielded after the resource which fills it, so it can be bigger by
+            the attributes of one resource. Resources and attributes are in
+            the same order as in build_details
+        """
+        if chunk_size < 1:
+            raise BaseStandardException("chunk_size should be greater than 0")
+        resources = []
+        attributes = []
+        for resource in self._iter_branch(self._resource_model):
+            self._add_autoload_details(resource, resources, attributes)
+            if len(resources) + len(attributes) >= chunk_size:
+                yield AutoLoadDetails(resources, attributes)
+                resources = []
+                attributes = []
+        if resources or attributes:
+            yield AutoLoadDetails(resources, attributes)
+
+    def build_details_pages(
+        self, max_resources: int = 1000, max_attributes: int = 10000
+    ) -> list[AutoLoadDetails]:
+        """Build autoload details split into pages.
+
+        Every page has at most max_resources resources and max_attributes
+        attributes. Attributes are on the same page as their resource and pages
+        are in the order of build_details, so parents are on the same or earlier
+        pages than their children.
+        """
+        if max_resources < 1 or max_attributes < 1:
+            raise BaseStandardException(
+                "max_resources and max_attributes should be greater than 0"
+            )
+        pages = [AutoLoadDetails([], [])]
+        for resource in self._iter_branch(self._resource_model):
+            resources = []
+            attributes = []
+            self._add_autoload_details(resource, resources, attributes)
+            if len(attributes) > max_attributes:
+                raise BaseStandardException(
+                    f"Resource {resource.full_name} has {len(attributes)} "
+                    f"attributes, it doesn't fit a page of {max_attributes}"
+                )
+            page = pages[-1]
+            if (
+                len(page.resources) + len(resources) > max_resources
+                or len(page.attributes) + len(attributes) > max_attributes
+            ):
+                page = AutoLoadDetails([], [])
+                pages.append(page)
+            page.resources.extend(resources)
+            page.attributes.extend(attributes)
+        return pages
+
+    def _add_autoload_details(
+        self,
+        resource: AbstractResource,
+        resources: list[AutoLoadResource],
+        attributes: list[AutoLoadAttribute],
+    ) -> None:
+        resource.shell_name = resource.shell_name or self._resource_model.shell_name
         relative_address = self._get_relative_address(resource)
         if relative_address:
-            autoload_resource = AutoLoadResource(
-                model=resource.cloudshell_model_name,
-                name=resource.name,
-                relative_address=relative_address,
-                unique_identifier=self._get_uniq_id(resource),
-            )
-            result = [autoload_resource]
-        else:
-            result = []
-        return result
-
-    def _get_autoload_attributes(
-        self, resource: AbstractResource
-    ) -> list[AutoLoadAttribute]:
-        return [
-            AutoLoadAttribute(
-                relative_address=self._get_relative_address(resource),
-                attribute_name=str(name),
-                attribute_value=str(value),
+            resources.append(
+                AutoLoadResource(
+                    model=resource.cloudshell_model_name,
+                    name=resource.name,
+                    relative_address=relative_address,
+                    unique_identifier=self._get_uniq_id(resource),
+                )
             )
-            for name, value in resource.attributes.items()
-            if value is not None
-        ]
+        for name, value in resource.attributes.items():
+            if value is not None:
+                attributes.append(
+                    AutoLoadAttribute(
+                        relative_address=relative_address,
+                        attribute_name=str(name),
+                        attribute_value=str(value),
+                    )
+                )
 
     def _get_uniq_id(self, resource: AbstractResource) -> str:
         uniq_id = self._existed_resource_info.get_uniq_id(resource.full_name)
         if not uniq_id:
-            uniq_id = get_unique_id(self._existed_resource_info, resource)
+            uniq_id = get_unique_id(
+                self._existed_resource_info, resource, self._legacy_unique_ids
+            )
         return uniq_id
 
     def _get_relative_address(self, resource: AbstractResource) -> str:
@@ -111,21 +337,52 @@ class AutoloadDetailsBuilder:
 
     def _make_addr_uniq(self, ex_addr: str) -> str:
         # address should be unique, if we cannot get it previously from existed
-        # resource, but it presents on the resource we need to change it
-        addr, i = ex_addr, 0
-        while self._existed_resource_info.is_address_exists(addr):
+        # resource, but it presents on the resource or was already generated we
+        # need to change it
+        try:
+            return self._uniq_addr_map[ex_addr]
+        except KeyError:
+            pass
+
+        addr = ex_addr
+        if self._is_address_used(addr):
+            # suffixes are never released, so the search continues from the last
+            # allocated one and every suffix is checked once per base address
+            i = self._next_addr_suffix.get(ex_addr, 0)
             addr = f"{ex_addr}-{i}"
-            i += 1
+            while self._is_address_used(addr):
+                i += 1
+                addr = f"{ex_addr}-{i}"
+            self._next_addr_suffix[ex_addr] = i + 1
+
+        self._uniq_addr_map[ex_addr] = addr
+        self._used_addresses.add(addr)
         return addr
 
+    def _is_address_used(self, addr: str) -> bool:
+        return addr in self._used_addresses or (
+            self._existed_resource_info.is_address_exists(addr)
+        )
+
+
+def get_unique_id(
+    r_info: ExistedResourceInfo, resource: AbstractResource, legacy: bool = False
+) -> str:
+    """Get unique ID for the resource.
 
-def get_unique_id(r_info: ExistedResourceInfo, resource: AbstractResource) -> str:
-    """Get unique ID for the resource."""
-    unique_id = f"{r_info.uniq_id}+{resource.unique_identifier}"
-    return str(hash(unique_id))
+    The ID is the same in every process, legacy IDs are generated with the
+    built-in hash() and are different in every process.
+    """
+    unique_id = f"{r_info.uniq_id}+{resource.get_unique_identifier(legacy)}"
+    return get_str_hash(unique_id, legacy)
 
 
 def is_module_without_children(resource: AbstractResource) -> bool:
+    """Check if the module has no ports in its subtree.
+
+    It's kept for backward compatibility only, the builder prunes empty modules
+    with get_branch_children.
+    """
     from cloudshell.shell.standards.autoload_generic_models import (
         GenericModule,
         GenericSubModule,
@@ -138,3 +395,45 @@ def is_module_without_children(resource: AbstractResource) -> bool:
         return all(map(is_module_without_children, children))
     else:
         return False
+
+
+def get_branch_children(
+    resource: AbstractResource,
+) -> dict[int, list[AbstractResource]]:
+    """Get children of every resource in the branch without empty modules.
+
+    Keys are ids of the resources, empty modules are not included. Every resource
+    is visited once in a post-order pass, so a module is checked by the already
+    computed results for its children.
+    """
+    from cloudshell.shell.standards.autoload_generic_models import (
+        GenericModule,
+        GenericSubModule,
+    )
+
+    branch_children = {}
+    empty_modules = set()
+    # children are None until the children of the resource are processed
+    stack: list[tuple[AbstractResource, tuple | None]] = [(resource, None)]
+    while stack:
+        resource, children = stack.pop()
+        if children is None:
+            children = resource.extract_sub_resources()
+            stack.append((resource, children))
+            stack.extend((child, None) for child in children)
+            continue
+
+        if isinstance(resource, GenericSubModule):
+            is_empty = not children
+        elif isinstance(resource, GenericModule):
+            is_empty = all(id(child) in empty_modules for child in children)
+        else:
+            is_empty = False
+
+        if is_empty:
+            empty_modules.add(id(resource))
+        else:
+            branch_children[id(resource)] = [
+                child for child in children if id(child) not in empty_modules
+            ]
+    return branch_children
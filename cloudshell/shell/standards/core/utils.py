@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import hashlib
 import re
 from collections.abc import Iterator
 
@@ -64,3 +65,15 @@ def validate_str_for_cs(value: str) -> None:
         raise TooLongStrValue(value)
     if CS_ALLOWED_STR_PATTERN.match(value) is None:
         raise NotSupportedSymbols(value)
+
+
+def get_str_hash(value: str, legacy: bool = False) -> str:
+    """Return a hash of the string as a decimal number.
+
+    The hash is a 64 bit digest and it's the same in every process, legacy hash
+    is the built-in hash() which is randomized per process by PYTHONHASHSEED.
+    """
+    if legacy:
+        return str(hash(value))
+    digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    return str(int.from_bytes(digest, "big", signed=True))
@@ -8,3 +8,19 @@ class ResourceModelException(BaseStandardException):
 
 class ResourceConfigException(BaseStandardException):
     pass
+
+
+class ExistedResourceInfoException(BaseStandardException):
+    pass
+
+
+class ExistedResourceInfoTimeout(ExistedResourceInfoException):
+    pass
+
+
+class ExistedResourceInfoCancelled(ExistedResourceInfoException):
+    pass
+
+
+class CircuitBreakerOpen(BaseStandardException):
+    pass
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from cloudshell.shell.standards.core.autoload.core_entities import (
+    InstanceAttribute,
+    RelativeAddress,
+)
+
+
+def _create_children(parent: RelativeAddress, indexes: list[str]):
+    return [RelativeAddress(index, "P", parent) for index in indexes]
+
+
+def test_duplicated_indexes():
+    parent = RelativeAddress("1", "CH")
+    ports = _create_children(parent, ["1", "2", "1", "3", "1"])
+
+    assert [str(port) for port in ports] == [
+        "CH1/P1-0",
+        "CH1/P2",
+        "CH1/P1-1",
+        "CH1/P3",
+        "CH1/P1-2",
+    ]
+
+
+def test_duplicated_indexes_with_different_prefixes():
+    parent = RelativeAddress("1", "CH")
+    port = RelativeAddress("1", "P", parent)
+    module = RelativeAddress("1", "M", parent)
+
+    assert (str(port), str(module)) == ("CH1/P1", "CH1/M1")
+
+
+def test_index_changed_after_registration():
+    parent = RelativeAddress("1", "CH")
+    port1, port2 = _create_children(parent, ["1", "1"])
+
+    port2.index = "2"
+
+    assert (port1.index, port2.index) == ("1-0", "2")
+
+
+def test_duplicated_indexes_lookup_is_constant():
+    # every index lookup used to scan all nodes with the same native index
+    parent = RelativeAddress("1", "CH")
+    ports = _create_children(parent, ["1"] * 10000)
+    native_index = RelativeAddress.native_index
+    reads = []
+
+    def get_native_index(node):
+        reads.append(node)
+        return native_index.fget(node)
+
+    with patch.object(
+        RelativeAddress, "native_index", property(get_native_index, native_index.fset)
+    ):
+        indexes = [port.index for port in ports]
+
+    assert indexes == [f"1-{i}" for i in range(10000)]
+    # only the native index of the node itself is read
+    assert set(map(id, reads)) == set(map(id, ports))
+    assert len(reads) <= 3 * len(ports)
+
+
+def test_cached_address_invalidated():
+    chassis = RelativeAddress("1", "CH")
+    module = RelativeAddress("1", "M", chassis)
+    port = RelativeAddress("1", "P", module)
+    assert str(port) == "CH1/M1/P1"
+
+    chassis.index = "2"
+    assert str(port) == "CH2/M1/P1"
+
+    port.native_index = "3"
+    assert str(port) == "CH2/M1/P3"
+
+    port.parent_node = RelativeAddress("2", "M", chassis)
+    assert str(port) == "CH2/M2/P3"
+
+    # a duplicated index changes the address of the registered node
+    RelativeAddress("3", "P", port.parent_node)
+    assert str(port) == "CH2/M2/P3-0"
+
+
+class _Container:
+    value = InstanceAttribute()
+
+
+def test_instance_attribute_stored_in_instance():
+    first, second = _Container(), _Container()
+    first.value = "first"
+
+    assert (first.value, second.value) == ("first", None)
+    assert first.__dict__ == {"value_value": "first"}
+    second.value = "a" * 3000
+    assert second.value == "a" * 2000
@@ -0,0 +1,643 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from cloudshell.shell.standards.core.autoload.async_existed_resource_info import (
+    AsyncExistedResourceInfo,
+)
+from cloudshell.shell.standards.core.autoload.existed_resource_info import (
+    ExistedResourceInfo,
+)
+from cloudshell.shell.standards.core.autoload.retry_policy import RetryPolicy
+from cloudshell.shell.standards.core.autoload.snapshot_store import (
+    ExistedResourceSnapshotStore,
+)
+from cloudshell.shell.standards.exceptions import (
+    BaseStandardException,
+    ExistedResourceInfoCancelled,
+    ExistedResourceInfoTimeout,
+)
+
+ROOT_NAME = "Switch"
+
+
+def _r_info(name: str, address: str, uniq_id: str, children=()) -> Mock:
+    r_info = Mock(
+        FullAddress=f"192.168.1.3/{address}" if address else "192.168.1.3",
+        UniqeIdentifier=uniq_id,
+        ChildResources=list(children),
+    )
+    r_info.Name = name
+    return r_info
+
+
+def _create_tree(chassis_count: int = 3, ports_count: int = 2) -> dict[str, Mock]:
+    """Creates CS resources info as returned by GetResourceDetails by names."""
+    resources = {}
+    children = []
+    for ch in range(1, chassis_count + 1):
+        ch_name = f"{ROOT_NAME}/Chassis {ch}"
+        ports = [
+            _r_info(f"{ch_name}/Port {p}", f"CH{ch}/P{p}", f"id-{ch}-{p}")
+            for p in range(1, ports_count + 1)
+        ]
+        chassis = _r_info(ch_name, f"CH{ch}", f"id-{ch}", ports)
+        resources[ch_name] = chassis
+        # root resource contains invalid unique ids for children
+        invalid_ports = [
+            _r_info(port.Name, port.FullAddress.split("/", 1)[1], "invalid id")
+            for port in ports
+        ]
+        children.append(_r_info(ch_name, f"CH{ch}", "invalid id", invalid_ports))
+    resources[ROOT_NAME] = _r_info(ROOT_NAME, "", "root id", children)
+    return resources
+
+
+class _Api:
+    def __init__(self, resources: dict[str, Mock], delay: float = 0):
+        self._resources = resources
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    def GetResourceDetails(self, name: str) -> Mock:  # noqa: N802
+        with self._lock:
+            self.calls.append(name)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self._delay)
+        with self._lock:
+            self.active -= 1
+        return self._resources[name]
+
+
+def _load(api: _Api, **kwargs) -> ExistedResourceInfo:
+    info = ExistedResourceInfo(ROOT_NAME, api, **kwargs)
+    info.load_data()
+    info.wait_until_loaded()
+    return info
+
+
+def _maps(info: ExistedResourceInfo) -> tuple[dict[str, str], ...]:
+    return (
+        info._full_name_to_uniq_id,
+        info._uniq_id_to_full_name,
+        info._full_name_to_address,
+        info._address_to_full_name,
+    )
+
+
+def test_load_data_serial():
+    api = _Api(_create_tree())
+
+    info = _load(api)
+
+    assert info.uniq_id == "root id"
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2") == "id-2"
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 1") == "id-2-1"
+    assert info.get_address(f"{ROOT_NAME}/Chassis 3/Port 2") == "CH3/P2"
+    assert info.is_address_exists("CH1/P1")
+    assert not info.is_address_exists("CH4")
+    assert info.get_full_name_by_unique_id("id-1") == f"{ROOT_NAME}/Chassis 1"
+    assert api.max_active == 1
+
+
+def test_load_data_concurrently_gives_same_result():
+    serial_info = _load(_Api(_create_tree(chassis_count=8)))
+    api = _Api(_create_tree(chassis_count=8), delay=0.05)
+
+    info = _load(api, max_workers=4)
+
+    assert _maps(info) == _maps(serial_info)
+    assert 1 < api.max_active <= 4
+    assert len(api.calls) == 9
+
+
+def test_load_data_concurrently_with_duplicate_names():
+    resources = _create_tree(chassis_count=2)
+    root = resources[ROOT_NAME]
+    root.ChildResources.append(root.ChildResources[0])
+    serial_info = _load(_Api(resources))
+
+    info = _load(_Api(resources), max_workers=3)
+
+    assert _maps(info) == _maps(serial_info)
+
+
+@pytest.mark.parametrize("lazy_uniq_ids", [False, True])
+def test_load_data_with_compact_maps(lazy_uniq_ids):
+    dict_info = _load(_Api(_create_tree()))
+
+    info = _load(_Api(_create_tree()), compact_maps=True, lazy_uniq_ids=lazy_uniq_ids)
+
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 1") == "id-2-1"
+    assert info.get_full_name_by_unique_id("id-1") == f"{ROOT_NAME}/Chassis 1"
+    assert info.is_address_exists("CH3/P2")
+    assert _maps(info) == _maps(dict_info)
+
+
+def test_invalid_max_workers():
+    with pytest.raises(BaseStandardException):
+        ExistedResourceInfo(ROOT_NAME, Mock(), max_workers=0)
+
+
+def test_load_data_started_once():
+    api = _Api(_create_tree(chassis_count=1))
+    info = _load(api)
+
+    info.load_data()
+    info.wait_until_loaded()
+
+    assert len(api.calls) == 2
+
+
+def test_lazy_uniq_ids_uses_single_call():
+    api = _Api(_create_tree())
+
+    info = _load(api, lazy_uniq_ids=True)
+
+    assert api.calls == [ROOT_NAME]
+    assert info.uniq_id == "root id"
+    assert info.get_address(f"{ROOT_NAME}/Chassis 2/Port 1") == "CH2/P1"
+    assert info.is_address_exists("CH3/P2")
+    assert api.calls == [ROOT_NAME]
+
+
+def test_lazy_uniq_ids_loads_only_requested_subtree():
+    api = _Api(_create_tree())
+    info = _load(api, lazy_uniq_ids=True)
+
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 1") == "id-2-1"
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2") == "id-2"
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 5") is None
+
+    assert api.calls == [ROOT_NAME, f"{ROOT_NAME}/Chassis 2"]
+
+
+def test_lazy_uniq_ids_get_full_name_by_unique_id():
+    api = _Api(_create_tree())
+    eager_info = _load(_Api(_create_tree()))
+    info = _load(api, lazy_uniq_ids=True)
+
+    assert info.get_full_name_by_unique_id("id-3-1") == f"{ROOT_NAME}/Chassis 3/Port 1"
+    assert info.get_full_name_by_unique_id("unknown") is None
+    assert len(api.calls) == 4
+    assert _maps(info) == _maps(eager_info)
+
+
+def test_snapshot_store_warm_load(tmp_path):
+    store = ExistedResourceSnapshotStore(tmp_path)
+    cold_info = _load(_Api(_create_tree()), snapshot_store=store)
+    api = _Api(_create_tree())
+
+    info = _load(api, snapshot_store=store)
+
+    assert api.calls == [ROOT_NAME]
+    assert _maps(info) == _maps(cold_info)
+
+
+def test_snapshot_store_root_changed(tmp_path):
+    store = ExistedResourceSnapshotStore(tmp_path)
+    _load(_Api(_create_tree()), snapshot_store=store)
+    resources = _create_tree()
+    resources[ROOT_NAME].UniqeIdentifier = "new root id"
+    api = _Api(resources)
+
+    info = _load(api, snapshot_store=store)
+
+    assert len(api.calls) == 4
+    snapshot = store.get(ROOT_NAME, "new root id")
+    assert snapshot.full_name_to_uniq_id == info._full_name_to_uniq_id
+    assert snapshot.full_name_to_address == info._full_name_to_address
+
+
+def test_snapshot_store_sub_resources_changed(tmp_path):
+    store = ExistedResourceSnapshotStore(tmp_path)
+    _load(_Api(_create_tree()), snapshot_store=store)
+    resources = _create_tree()
+    _add_port(resources, 2, 3)
+    api = _Api(resources)
+
+    info = _load(api, snapshot_store=store)
+
+    # the root unique id is the same but the snapshot is stale
+    assert len(api.calls) == 4
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 3") == "id-2-3"
+    warm_api = _Api(resources)
+    assert _maps(_load(warm_api, snapshot_store=store)) == _maps(info)
+    assert warm_api.calls == [ROOT_NAME]
+
+
+def test_get_snapshot_loads_lazy_uniq_ids():
+    eager_info = _load(_Api(_create_tree()))
+    info = _load(_Api(_create_tree()), lazy_uniq_ids=True)
+
+    snapshot = info.get_snapshot()
+
+    assert snapshot.full_name_to_uniq_id == eager_info._full_name_to_uniq_id
+    assert snapshot.full_name_to_address == eager_info._full_name_to_address
+
+
+def _load_async(api, **kwargs) -> AsyncExistedResourceInfo:
+    async def load():
+        info = AsyncExistedResourceInfo(ROOT_NAME, api, **kwargs)
+        info.load_data()
+        await info.wait_until_loaded()
+        return info
+
+    return asyncio.run(load())
+
+
+def test_async_load_data_gives_same_result():
+    serial_info = _load(_Api(_create_tree(chassis_count=8)))
+    api = _Api(_create_tree(chassis_count=8), delay=0.05)
+
+    info = _load_async(api, max_concurrency=4)
+
+    assert _maps(info) == _maps(serial_info)
+    assert 1 < api.max_active <= 4
+    assert len(api.calls) == 9
+
+
+def test_async_lookups():
+    async def lookups():
+        info = AsyncExistedResourceInfo(ROOT_NAME, _Api(_create_tree()))
+        info.load_data()
+        return (
+            await info.uniq_id,
+            await info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 1"),
+            await info.get_address(f"{ROOT_NAME}/Chassis 3"),
+            await info.is_address_exists("CH1/P2"),
+            await info.is_address_exists("CH1/P3"),
+            await info.get_full_name_by_unique_id("id-1"),
+        )
+
+    result = asyncio.run(lookups())
+
+    assert result == (
+        "root id",
+        "id-2-1",
+        "CH3",
+        True,
+        False,
+        f"{ROOT_NAME}/Chassis 1",
+    )
+
+
+def test_async_load_data_with_async_api():
+    resources = _create_tree()
+    calls = []
+
+    class AsyncApi:
+        async def GetResourceDetails(self, name):  # noqa: N802
+            calls.append(name)
+            await asyncio.sleep(0)
+            return resources[name]
+
+    info = _load_async(AsyncApi())
+
+    assert _maps(info) == _maps(_load(_Api(_create_tree())))
+    assert len(calls) == 4
+
+
+def test_async_wait_without_loading():
+    info = AsyncExistedResourceInfo(ROOT_NAME, _Api(_create_tree()))
+
+    with pytest.raises(BaseStandardException):
+        asyncio.run(info.wait_until_loaded())
+
+
+class _FailingApi(_Api):
+    def __init__(self, resources: dict[str, Mock], fail_on: str, delay: float = 0):
+        super().__init__(resources, delay)
+        self._fail_on = fail_on
+
+    def GetResourceDetails(self, name: str) -> Mock:  # noqa: N802
+        result = super().GetResourceDetails(name)
+        if name == self._fail_on:
+            raise ConnectionError(name)
+        return result
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_load_error_is_raised_in_waiters(max_workers):
+    api = _FailingApi(_create_tree(), f"{ROOT_NAME}/Chassis 2")
+    info = ExistedResourceInfo(ROOT_NAME, api, max_workers=max_workers)
+    info.load_data()
+
+    with pytest.raises(ConnectionError):
+        info.wait_until_loaded()
+    with pytest.raises(ConnectionError):
+        info.get_address(f"{ROOT_NAME}/Chassis 1")
+
+
+def test_loading_thread_is_daemon():
+    info = ExistedResourceInfo(ROOT_NAME, _Api(_create_tree(), delay=0.05))
+    info.load_data()
+
+    threads = [
+        t for t in threading.enumerate() if t.name == f"ExistedResourceInfo-{ROOT_NAME}"
+    ]
+
+    assert threads and all(t.daemon for t in threads)
+    info.wait_until_loaded()
+
+
+def test_wait_until_loaded_timeout():
+    info = ExistedResourceInfo(ROOT_NAME, _Api(_create_tree(), delay=0.1))
+    info.load_data()
+
+    with pytest.raises(ExistedResourceInfoTimeout):
+        info.wait_until_loaded(timeout=0.01)
+    info.wait_until_loaded()
+
+
+class _BlockingApi(_Api):
+    """Calls for the root children are blocked until release is set."""
+
+    def __init__(self, resources: dict[str, Mock]):
+        super().__init__(resources)
+        self.release = threading.Event()
+
+    def GetResourceDetails(self, name: str) -> Mock:  # noqa: N802
+        if name != ROOT_NAME:
+            self.release.wait()
+        return super().GetResourceDetails(name)
+
+
+def _start_blocked_loading(**kwargs) -> tuple[ExistedResourceInfo, _BlockingApi]:
+    api = _BlockingApi(_create_tree(chassis_count=8))
+    info = ExistedResourceInfo(ROOT_NAME, api, **kwargs)
+    info.load_data()
+    return info, api
+
+
+def _release_and_join(api: _BlockingApi) -> None:
+    (thread,) = [
+        t for t in threading.enumerate() if t.name == f"ExistedResourceInfo-{ROOT_NAME}"
+    ]
+    api.release.set()
+    thread.join()
+
+
+def test_load_timeout():
+    info, api = _start_blocked_loading(load_timeout=0.05)
+
+    with pytest.raises(ExistedResourceInfoTimeout, match="in 0.05 seconds"):
+        info.uniq_id
+    _release_and_join(api)
+
+    # the loading call of the first chassis is finished, others are not started
+    assert api.calls == [ROOT_NAME, f"{ROOT_NAME}/Chassis 1"]
+
+
+def test_load_timeout_before_wait_timeout():
+    info, api = _start_blocked_loading(load_timeout=0.05)
+
+    try:
+        with pytest.raises(ExistedResourceInfoTimeout, match="in 0.05 seconds"):
+            info.wait_until_loaded(timeout=5)
+        assert info.is_failed
+    finally:
+        _release_and_join(api)
+
+
+def test_cancel():
+    api = _Api(_create_tree(chassis_count=8), delay=0.05)
+    info = ExistedResourceInfo(ROOT_NAME, api)
+    info.load_data()
+    time.sleep(0.01)
+
+    info.cancel()
+
+    with pytest.raises(ExistedResourceInfoCancelled):
+        info.wait_until_loaded()
+    time.sleep(0.1)
+    assert len(api.calls) < 9
+
+
+def test_async_load_error_is_raised_in_waiters():
+    api = _FailingApi(_create_tree(), f"{ROOT_NAME}/Chassis 2")
+
+    with pytest.raises(ConnectionError):
+        _load_async(api)
+
+
+def test_async_wait_until_loaded_timeout():
+    async def load():
+        info = AsyncExistedResourceInfo(ROOT_NAME, _Api(_create_tree(), delay=0.1))
+        info.load_data()
+        with pytest.raises(ExistedResourceInfoTimeout):
+            await info.wait_until_loaded(timeout=0.01)
+        await info.wait_until_loaded()
+
+    asyncio.run(load())
+
+
+def test_async_load_timeout():
+    api = _Api(_create_tree(chassis_count=8), delay=0.05)
+
+    with pytest.raises(ExistedResourceInfoTimeout):
+        _load_async(api, max_concurrency=1, load_timeout=0.12)
+
+
+def test_async_cancel():
+    async def load():
+        info = AsyncExistedResourceInfo(ROOT_NAME, _Api(_create_tree(), delay=0.05))
+        info.load_data()
+        await asyncio.sleep(0.01)
+        info.cancel()
+        with pytest.raises(ExistedResourceInfoCancelled):
+            await info.wait_until_loaded()
+
+    asyncio.run(load())
+
+
+def _add_port(resources: dict[str, Mock], ch: int, port: int) -> None:
+    ch_name = f"{ROOT_NAME}/Chassis {ch}"
+    name, address = f"{ch_name}/Port {port}", f"CH{ch}/P{port}"
+    resources[ch_name].ChildResources.append(_r_info(name, address, f"id-{ch}-{port}"))
+    root_child = next(
+        c for c in resources[ROOT_NAME].ChildResources if c.Name == ch_name
+    )
+    root_child.ChildResources.append(_r_info(name, address, "invalid id"))
+
+
+@pytest.mark.parametrize("compact_maps", [False, True])
+def test_refresh_reloads_only_changed_subtrees(compact_maps):
+    resources = _create_tree()
+    api = _Api(resources)
+    info = _load(api, compact_maps=compact_maps)
+    _add_port(resources, 2, 3)
+    api.calls.clear()
+
+    info.refresh()
+
+    assert api.calls == [ROOT_NAME, f"{ROOT_NAME}/Chassis 2"]
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 3") == "id-2-3"
+    assert _maps(info) == _maps(_load(_Api(resources)))
+
+
+def test_refresh_removed_resource():
+    resources = _create_tree()
+    api = _Api(resources)
+    info = _load(api)
+    ch_name = f"{ROOT_NAME}/Chassis 3"
+    resources[ch_name].ChildResources.pop()
+    next(
+        c for c in resources[ROOT_NAME].ChildResources if c.Name == ch_name
+    ).ChildResources.pop()
+    api.calls.clear()
+
+    info.refresh()
+
+    assert api.calls == [ROOT_NAME, ch_name]
+    assert not info.is_address_exists("CH3/P2")
+    assert _maps(info) == _maps(_load(_Api(resources)))
+
+
+def test_refresh_without_changes():
+    api = _Api(_create_tree())
+    info = _load(api)
+    old_maps = _maps(info)
+    api.calls.clear()
+
+    info.refresh()
+
+    assert api.calls == [ROOT_NAME]
+    assert _maps(info) == old_maps
+
+
+def test_refresh_root_changed():
+    resources = _create_tree()
+    api = _Api(resources)
+    info = _load(api)
+    resources[ROOT_NAME].UniqeIdentifier = "new root id"
+    api.calls.clear()
+
+    info.refresh()
+
+    assert len(api.calls) == 4
+    assert info.uniq_id == "new root id"
+
+
+def test_refresh_lazy_uniq_ids():
+    resources = _create_tree()
+    api = _Api(resources)
+    info = _load(api, lazy_uniq_ids=True)
+    info.get_uniq_id(f"{ROOT_NAME}/Chassis 1")
+    info.get_uniq_id(f"{ROOT_NAME}/Chassis 2")
+    _add_port(resources, 2, 3)
+    api.calls.clear()
+
+    info.refresh()
+
+    assert api.calls == [ROOT_NAME]
+    assert info.get_address(f"{ROOT_NAME}/Chassis 2/Port 3") == "CH2/P3"
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 1/Port 1") == "id-1-1"
+    assert api.calls == [ROOT_NAME]
+    assert info.get_uniq_id(f"{ROOT_NAME}/Chassis 2/Port 3") == "id-2-3"
+    assert api.calls == [ROOT_NAME, f"{ROOT_NAME}/Chassis 2"]
+
+
+def test_stats():
+    callback = Mock()
+    api = _Api(_create_tree(), delay=0.02)
+    info = ExistedResourceInfo(ROOT_NAME, api, stats_callback=callback)
+    info.load_data()
+
+    info.wait_until_loaded()
+    info.get_address(f"{ROOT_NAME}/Chassis 1")
+
+    stats = info.stats
+    callback.assert_called_once_with(stats)
+    assert stats.api_calls == 4
+    assert len(stats.api_call_times) == 4
+    assert all(t >= 0.02 for t in stats.api_call_times)
+    assert stats.api_time <= stats.load_time
+    assert stats.wait_time > 0
+    assert stats.full_names_count == 9
+    assert stats.uniq_ids_count == 9
+
+
+def test_stats_refresh():
+    callback = Mock()
+    info = _load(_Api(_create_tree()), stats_callback=callback)
+
+    info.refresh()
+
+    assert callback.call_count == 2
+    assert info.stats.api_calls == 5
+
+
+def test_async_stats():
+    callback = Mock()
+
+    info = _load_async(_Api(_create_tree()), stats_callback=callback)
+
+    callback.assert_called_once_with(info.stats)
+    assert info.stats.api_calls == 4
+    assert info.stats.wait_time > 0
+    assert info.stats.full_names_count == 9
+
+
+class _FlakyApi(_Api):
+    def __init__(self, resources: dict[str, Mock], failures: int):
+        super().__init__(resources)
+        self._failures = failures
+
+    def GetResourceDetails(self, name: str) -> Mock:  # noqa: N802
+        result = super().GetResourceDetails(name)
+        if self._failures:
+            self._failures -= 1
+            raise ConnectionError(name)
+        return result
+
+
+def test_retry_policy():
+    api = _FlakyApi(_create_tree(), failures=2)
+
+    info = _load(api, retry_policy=RetryPolicy(backoff=0.01))
+
+    assert _maps(info) == _maps(_load(_Api(_create_tree())))
+    assert info.stats.api_calls == 6
+
+
+def test_retry_policy_cancel():
+    api = _FlakyApi(_create_tree(), failures=2)
+    info = ExistedResourceInfo(ROOT_NAME, api, retry_policy=RetryPolicy(backoff=10))
+    info.load_data()
+    time.sleep(0.01)
+
+    info.cancel()
+
+    with pytest.raises(ExistedResourceInfoCancelled):
+        info.wait_until_loaded()
+
+
+def test_async_retry_policy():
+    api = _FlakyApi(_create_tree(), failures=2)
+
+    info = _load_async(api, retry_policy=RetryPolicy(backoff=0.01))
+
+    assert _maps(info) == _maps(_load(_Api(_create_tree())))
+
+
+def test_get_full_names():
+    info = _load(_Api(_create_tree()))
+
+    assert sorted(info.get_full_names()) == sorted(info._full_name_to_address)
+    assert asyncio.run(_get_full_names_async()) == sorted(info.get_full_names())
+
+
+async def _get_full_names_async() -> list[str]:
+    info = AsyncExistedResourceInfo(ROOT_NAME, _Api(_create_tree()))
+    info.load_data()
+    return sorted(await info.get_full_names())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cloudshell.shell.standards.core.autoload.existed_resource_registry import (
+    ExistedResourceInfoRegistry,
+)
+from cloudshell.shell.standards.exceptions import BaseStandardException
+
+
+@pytest.fixture()
+def api():
+    def get_resource_details(name):
+        time.sleep(0.05)
+        if api.fail:
+            raise ConnectionError(name)
+        return Mock(UniqeIdentifier=f"{name} id", ChildResources=[])
+
+    api = Mock(GetResourceDetails=Mock(side_effect=get_resource_details), fail=False)
+    return api
+
+
+def test_concurrent_loads_are_shared(api):
+    registry = ExistedResourceInfoRegistry()
+
+    with ThreadPoolExecutor(5) as executor:
+        infos = list(executor.map(lambda _: registry.get("Switch", api), range(5)))
+
+    assert all(info is infos[0] for info in infos)
+    assert infos[0].uniq_id == "Switch id"
+    assert api.GetResourceDetails.call_count == 1
+
+
+def test_different_resources(api):
+    registry = ExistedResourceInfoRegistry()
+
+    switch_info = registry.get("Switch", api)
+    router_info = registry.get("Router", api)
+
+    assert switch_info is not router_info
+    assert router_info.uniq_id == "Router id"
+
+
+def test_expired_info_is_reloaded(api):
+    registry = ExistedResourceInfoRegistry(freshness=10)
+    info = registry.get("Switch", api)
+    info.wait_until_loaded()
+
+    assert registry.get("Switch", api) is info
+    with patch("time.monotonic", return_value=time.monotonic() + 11):
+        assert registry.get("Switch", api) is not info
+
+
+def test_failed_info_is_reloaded(api):
+    registry = ExistedResourceInfoRegistry()
+    api.fail = True
+    info = registry.get("Switch", api)
+    with pytest.raises(ConnectionError):
+        info.wait_until_loaded()
+    api.fail = False
+
+    new_info = registry.get("Switch", api)
+
+    assert new_info is not info
+    assert new_info.uniq_id == "Switch id"
+
+
+def test_invalidate(api):
+    registry = ExistedResourceInfoRegistry()
+    info = registry.get("Switch", api, max_workers=2)
+
+    registry.invalidate("Switch")
+
+    assert registry.get("Switch", api) is not info
+
+
+def test_expired_entries_are_removed(api):
+    registry = ExistedResourceInfoRegistry(freshness=10)
+    registry.get("Switch", api).wait_until_loaded()
+
+    with patch("time.monotonic", return_value=time.monotonic() + 11):
+        registry.get("Router", api)
+
+    assert list(registry._entries) == ["Router"]
+
+
+def test_other_settings(api):
+    registry = ExistedResourceInfoRegistry()
+    info = registry.get("Switch", api, max_workers=2)
+
+    assert registry.get("Switch", api, max_workers=2) is info
+    with pytest.raises(BaseStandardException, match="shared with other settings"):
+        registry.get("Switch", api, lazy_uniq_ids=True)
+
+
+@pytest.mark.parametrize("method", ("cancel", "refresh"))
+def test_shared_info_cant_be_changed(api, method):
+    registry = ExistedResourceInfoRegistry()
+    info = registry.get("Switch", api)
+
+    with pytest.raises(BaseStandardException, match="Shared existed resource info"):
+        getattr(info, method)()
+
+    assert info.uniq_id == "Switch id"
+    assert api.GetResourceDetails.call_count == 1
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from cloudshell.shell.standards.core.autoload.resource_maps import (
+    CompactResourceMaps,
+    ResourceMaps,
+)
+
+
+def _fill_maps(maps: ResourceMaps | CompactResourceMaps, modules: int, ports: int):
+    for m in range(1, modules + 1):
+        module_name = f"Cisco Nexus 9000 Lab Switch/Chassis 1/Module {m}"
+        maps.add_address(module_name, f"CH1/M{m}")
+        maps.add_uniq_id(module_name, f"{m:032x}")
+        for p in range(1, ports + 1):
+            port_name = f"{module_name}/Ethernet{m}-{p}"
+            maps.add_address(port_name, f"CH1/M{m}/P{p}")
+            maps.add_uniq_id(port_name, f"{m * 1000 + p:032x}")
+
+
+def _get_maps(maps: ResourceMaps | CompactResourceMaps) -> tuple[dict, ...]:
+    return (
+        dict(maps.full_name_to_uniq_id),
+        dict(maps.uniq_id_to_full_name),
+        dict(maps.full_name_to_address),
+        dict(maps.address_to_full_name),
+    )
+
+
+def test_compact_maps_equal_to_dict_maps():
+    maps = ResourceMaps()
+    compact_maps = CompactResourceMaps()
+
+    _fill_maps(maps, 3, 4)
+    _fill_maps(compact_maps, 3, 4)
+
+    assert _get_maps(compact_maps) == _get_maps(maps)
+    assert compact_maps.full_name_to_address == maps.full_name_to_address
+    assert len(compact_maps.address_to_full_name) == 15
+
+
+def test_compact_maps_lookups():
+    maps = CompactResourceMaps()
+    maps.add_address("Switch/Chassis 1", "CH1")
+    maps.add_address("Switch/Chassis 1/Port 1", "CH1/P1")
+    maps.add_uniq_id("Switch/Chassis 1/Port 1", "port id")
+
+    assert maps.full_name_to_address.get("Switch/Chassis 1/Port 1") == "CH1/P1"
+    assert maps.full_name_to_uniq_id.get("Switch/Chassis 1/Port 1") == "port id"
+    assert maps.full_name_to_uniq_id.get("Switch/Chassis 1") is None
+    assert maps.full_name_to_address.get("Switch") is None
+    assert maps.full_name_to_address.get("Switch/Chassis 1/Port 1/Sub") is None
+    assert "CH1/P1" in maps.address_to_full_name
+    assert "CH1/P2" not in maps.address_to_full_name
+    assert "" not in maps.address_to_full_name
+    assert maps.uniq_id_to_full_name["port id"] == "Switch/Chassis 1/Port 1"
+
+    maps.add_uniq_id("Switch/Chassis 1", "chassis id")
+
+    assert maps.uniq_id_to_full_name.get("chassis id") == "Switch/Chassis 1"
+
+
+def test_compact_maps_are_read_only():
+    maps = CompactResourceMaps()
+
+    with pytest.raises(TypeError):
+        maps.full_name_to_address["Switch/Chassis 1"] = "CH1"
+
+
+def _get_allocated_size(maps_cls) -> int:
+    tracemalloc.start()
+    try:
+        maps = maps_cls()
+        _fill_maps(maps, 50, 200)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(maps.full_name_to_address) == 50 * 201
+    return size
+
+
+def test_compact_maps_memory_benchmark():
+    dict_maps_size = _get_allocated_size(ResourceMaps)
+    compact_maps_size = _get_allocated_size(CompactResourceMaps)
+
+    # about 0.78 for 10k resources with unique port names
+    assert compact_maps_size < dict_maps_size * 0.85
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from array import array
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+
+from cloudshell.shell.standards.autoload_generic_models import (
+    GenericChassis,
+    GenericModule,
+    GenericPort,
+)
+from cloudshell.shell.standards.core.autoload.core_entities import RelativeAddress
+from cloudshell.shell.standards.core.autoload.resource_model import AbstractResource
+from cloudshell.shell.standards.exceptions import ResourceModelException
+
+
+def _create_port():
+    chassis = GenericChassis("1")
+    module = GenericModule("1")
+    port = GenericPort("1")
+    chassis.connect_module(module)
+    module.connect_port(port)
+    return chassis, module, port
+
+
+def test_cached_full_name_invalidated():
+    chassis, module, port = _create_port()
+    assert port.full_name == "Chassis 1/Module 1/Port 1"
+
+    module._name = "Line Card"
+    assert port.full_name == "Chassis 1/Line Card/Port 1"
+
+    chassis.relative_address.index = "2"
+    assert port.full_name == "Chassis 2/Line Card/Port 1"
+
+    port.relative_address.index = "2"
+    assert port.name == "Port 2"
+    assert port.full_name == "Chassis 2/Line Card/Port 2"
+
+    new_module = GenericModule("3")
+    chassis.connect_module(new_module)
+    new_module.connect_port(port)
+    assert port.full_name == "Chassis 2/Module 3/Port 2"
+
+
+def test_cached_name_changed_by_duplicated_index():
+    _, module, port = _create_port()
+    assert port.name == "Port 1"
+
+    module.connect_port(GenericPort("1"))
+
+    assert port.name == "Port 1-0"
+    assert str(port.relative_address) == "CH1/M1/P1-0"
+
+
+def test_cache_is_not_invalidated_by_other_trees():
+    chassis, module, port = _create_port()
+    assert port.full_name == "Chassis 1/Module 1/Port 1"
+    assert str(port.relative_address) == "CH1/M1/P1"
+
+    with patch.object(
+        RelativeAddress,
+        "_build_full_address",
+        autospec=True,
+        side_effect=RelativeAddress._build_full_address,
+    ) as build_full_address, patch.object(
+        AbstractResource,
+        "_gen_name",
+        autospec=True,
+        side_effect=AbstractResource._gen_name,
+    ) as gen_name:
+        other_chassis = _create_ports(2, 10)
+        other_chassis.extract_sub_resources()[0]._name = "Line Card"
+        assert port.full_name == "Chassis 1/Module 1/Port 1"
+        assert str(port.relative_address) == "CH1/M1/P1"
+
+    assert build_full_address.call_count == 0
+    assert gen_name.call_count == 0
+
+    module.connect_port(GenericPort("2"))
+    assert str(port.relative_address) == "CH1/M1/P1"
+    assert (
+        port.relative_address._cache_version == chassis.relative_address._tree_version
+    )
+
+
+def test_fingerprints():
+    chassis, module, port = _create_port()
+    other_module = GenericModule("2")
+    chassis.connect_module(other_module)
+    fingerprints = chassis.get_fingerprints()
+    assert chassis.fingerprint == fingerprints[id(chassis)]
+    assert len(set(fingerprints.values())) == 4
+
+    port.mac_address = "00:11:22:33:44:55"
+    new_fingerprints = chassis.get_fingerprints()
+
+    for resource in (chassis, module, port):
+        assert new_fingerprints[id(resource)] != fingerprints[id(resource)]
+    assert new_fingerprints[id(other_module)] == fingerprints[id(other_module)]
+
+
+def test_fingerprints_are_same_for_same_resources():
+    fingerprints = [_create_port()[0].fingerprint for _ in range(2)]
+
+    assert fingerprints[0] == fingerprints[1]
+
+
+def _create_ports(modules: int, ports: int) -> GenericChassis:
+    chassis = GenericChassis("1")
+    for module_id in range(modules):
+        module = GenericModule(str(module_id))
+        chassis.connect_module(module)
+        for port_id in range(ports):
+            module.connect_port(GenericPort(str(port_id)))
+    return chassis
+
+
+class _DictIndexValidator:
+    def __init__(self):
+        self.address_dict = defaultdict(lambda: defaultdict(list))
+
+
+class _DictAddress:
+    """Relative address as it was, with __dict__ and IndexValidator for every one."""
+
+    def __init__(self, index, prefix, parent_node=None):
+        self.parent_node = parent_node
+        self.index_validator = _DictIndexValidator()
+        self.native_index = index
+        self.prefix = prefix
+        if parent_node:
+            parent_node.index_validator.address_dict[prefix][index].append(self)
+
+
+class _DictResource:
+    """Resource as it was, with __dict__ for the resource and its address.
+
+    The name and the unique id were stored in the dicts of the descriptors.
+    """
+
+    names = {}
+    unique_ids = {}
+
+    def __init__(self, index, prefix, parent=None):
+        self.relative_address = _DictAddress(
+            index, prefix, parent and parent.relative_address
+        )
+        self.parent = parent
+        self.child_resources = []
+        self.attributes = {}
+        self.family_name = "CS_Port"
+        self.shell_name = None
+        self.resource_model = "GenericPort"
+        self.names[self] = None
+        self.unique_ids[self] = None
+        if parent:
+            parent.child_resources.append(self)
+
+
+def _create_dict_ports(modules: int, ports: int) -> _DictResource:
+    chassis = _DictResource("1", "CH")
+    for module_id in range(modules):
+        module = _DictResource(str(module_id), "M", chassis)
+        for port_id in range(ports):
+            _DictResource(str(port_id), "P", module)
+    return chassis
+
+
+def _get_allocated_size(create):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = create()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def test_ports_memory_benchmark():
+    chassis, size = _get_allocated_size(lambda: _create_ports(100, 100))
+    _, dict_size = _get_allocated_size(lambda: _create_dict_ports(100, 100))
+    _DictResource.names.clear()
+    _DictResource.unique_ids.clear()
+
+    assert len(chassis.extract_sub_resources()) == 100
+    # the sizes depend on the Python version, the resources with __slots__ take
+    # about 40-45% of the memory of the resources as they were
+    assert size < dict_size * 0.6
+
+
+def test_generic_resources_have_slots():
+    class CustomPort(GenericPort):
+        pass
+
+    port = GenericPort("1")
+    custom_port = CustomPort("2")
+    custom_port.custom_value = "value"
+
+    assert not hasattr(port, "__dict__")
+    with pytest.raises(AttributeError):
+        port.custom_value = "value"
+    assert custom_port.custom_value == "value"
+
+
+def test_attribute_access_doesnt_allocate():
+    chassis = _create_ports(10, 100)
+    ports = [
+        p for m in chassis.extract_sub_resources() for p in m.extract_sub_resources()
+    ]
+    for port in ports:
+        port.shell_name = "Shell"
+        port.mac_address = "00:11:22:33:44:55"
+        port.port_description = "description"
+
+    tracemalloc.start()
+    try:
+        for port in ports:
+            port.mac_address = port.mac_address
+            for name, value in port.attributes.items():
+                str(name)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # attribute names are cached, values are got and set without new keys
+    assert peak < 10000
+
+
+def test_attribute_name_cached_per_namespace():
+    port = GenericPort("1")
+    port.mac_address = "00:11:22:33:44:55"
+    (name,) = port.attributes
+
+    assert str(name) == "MAC Address"
+    port.shell_name = "Shell"
+    assert str(name) == "Shell.GenericPort.MAC Address"
+    port.resource_model = "Custom Port"
+    assert str(name) == "Shell.Custom Port.MAC Address"
+    port.shell_name = None
+    assert str(name) == "MAC Address"
+    assert port.mac_address == "00:11:22:33:44:55"
+    assert len(port.attributes) == 1
+
+
+def test_set_values():
+    ports = [GenericPort(str(i)) for i in range(4)]
+    ports[0].mtu = 1500
+    mtu_name = next(iter(ports[0].attributes))
+
+    GenericPort.mtu.set_values(ports, [9000, None, 0, 1500])
+    GenericPort.port_description.set_values(ports, ["d" * 3000, "", "a", "b"])
+
+    assert [p.mtu for p in ports] == [9000, 0, 0, 1500]
+    assert [p.port_description for p in ports] == ["d" * 2000, None, "a", "b"]
+    # the existed key is kept
+    assert next(iter(ports[0].attributes)) is mtu_name
+    assert all(len(p.attributes) == 2 for p in ports)
+
+
+def test_set_values_from_array():
+    ports = [GenericPort(str(i)) for i in range(3)]
+
+    GenericPort.mtu.set_values(ports, array("i", [1500, 0, 9000]))
+
+    assert [p.mtu for p in ports] == [1500, 0, 9000]
+
+
+def test_set_values_from_numpy_array():
+    np = pytest.importorskip("numpy")
+    ports = [GenericPort(str(i)) for i in range(3)]
+
+    GenericPort.mtu.set_values(ports, np.array([1500, 0, 9000]))
+    GenericPort.adjacent.set_values(ports, np.array(["a", "b", "c"]))
+
+    assert [type(p.mtu) for p in ports] == [int, int, int]
+    assert [p.adjacent for p in ports] == ["a", "b", "c"]
+
+
+def test_set_values_invalid_length():
+    ports = [GenericPort(str(i)) for i in range(3)]
+
+    with pytest.raises(ResourceModelException, match="MTU has 2 values for 3"):
+        GenericPort.mtu.set_values(ports, [1500, 1500])
+    assert all(not p.attributes for p in ports)
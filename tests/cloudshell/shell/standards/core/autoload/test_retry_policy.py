@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cloudshell.api.common_cloudshell_api import CloudShellAPIError
+
+from cloudshell.shell.standards.core.autoload.retry_policy import (
+    CircuitBreaker,
+    RetryPolicy,
+)
+from cloudshell.shell.standards.exceptions import CircuitBreakerOpen
+
+
+def _flaky(failures: int, error: Exception = ConnectionError("down")) -> Mock:
+    return Mock(side_effect=[error] * failures + ["result"])
+
+
+def test_retry_until_success():
+    func = _flaky(2)
+    sleep = Mock()
+
+    result = RetryPolicy(attempts=3).call(func, "arg", sleep=sleep)
+
+    assert result == "result"
+    assert func.call_count == 3
+    func.assert_called_with("arg")
+    assert sleep.call_count == 2
+
+
+def test_retry_attempts_exceeded():
+    func = _flaky(3)
+
+    with pytest.raises(ConnectionError):
+        RetryPolicy(attempts=3).call(func, sleep=Mock())
+    assert func.call_count == 3
+
+
+def test_not_retriable_error():
+    func = _flaky(1, CloudShellAPIError(100, "Resource not found", ""))
+
+    with pytest.raises(CloudShellAPIError):
+        RetryPolicy().call(func, sleep=Mock())
+    assert func.call_count == 1
+
+
+def test_cancelled_error_is_not_retriable():
+    policy = RetryPolicy(retry_on=(BaseException,), no_retry_on=())
+
+    assert not policy.is_retriable(asyncio.CancelledError())
+    assert policy.is_retriable(ConnectionError())
+
+
+@pytest.mark.parametrize(
+    ("attempt", "expected"), [(1, 0.5), (2, 1), (3, 2), (5, 8), (6, 10), (10, 10)]
+)
+def test_get_delay(attempt, expected):
+    policy = RetryPolicy(backoff=0.5, max_backoff=10, jitter=0.5)
+
+    with patch("random.random", return_value=0):
+        assert policy.get_delay(attempt) == expected
+    with patch("random.random", return_value=1):
+        assert policy.get_delay(attempt) == expected / 2
+
+
+def test_call_timeout():
+    func = Mock(side_effect=[lambda: time.sleep(1), lambda: "result"])
+    policy = RetryPolicy(call_timeout=0.05)
+
+    start = time.monotonic()
+    result = policy.call(lambda: func()(), sleep=Mock())
+
+    assert result == "result"
+    assert time.monotonic() - start < 0.5
+
+
+def test_invalid_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(attempts=0)
+
+
+def test_circuit_breaker_opens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    policy = RetryPolicy(attempts=2, circuit_breaker=breaker)
+    func = Mock(side_effect=ConnectionError("down"))
+
+    with pytest.raises(ConnectionError):
+        policy.call(func, sleep=Mock())
+    with pytest.raises(CircuitBreakerOpen):
+        policy.call(func, sleep=Mock())
+
+    assert breaker.is_open
+    assert func.call_count == 3
+
+
+def test_circuit_breaker_trial_call():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    policy = RetryPolicy(attempts=1, circuit_breaker=breaker)
+    with pytest.raises(ConnectionError):
+        policy.call(Mock(side_effect=ConnectionError("down")))
+
+    with patch("time.monotonic", return_value=time.monotonic() + 31):
+        # failed trial call opens the breaker again
+        with pytest.raises(ConnectionError):
+            policy.call(Mock(side_effect=ConnectionError("down")))
+        with pytest.raises(CircuitBreakerOpen):
+            policy.call(Mock())
+    with patch("time.monotonic", return_value=time.monotonic() + 62):
+        assert policy.call(Mock(return_value="result")) == "result"
+
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_interrupted_trial_call():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    policy = RetryPolicy(attempts=1, circuit_breaker=breaker)
+    with pytest.raises(ConnectionError):
+        policy.call(Mock(side_effect=ConnectionError("down")))
+
+    with patch("time.monotonic", return_value=time.monotonic() + 31):
+        with pytest.raises(KeyboardInterrupt):
+            policy.call(Mock(side_effect=KeyboardInterrupt))
+        # the next trial call is allowed
+        assert policy.call(Mock(return_value="result")) == "result"
+
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_cancelled_async_trial_call():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    policy = RetryPolicy(attempts=1, circuit_breaker=breaker)
+
+    async def fail():
+        raise ConnectionError("down")
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def succeed():
+        return "result"
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            await policy.call_async(fail)
+        with patch("time.monotonic", return_value=time.monotonic() + 31):
+            task = asyncio.ensure_future(policy.call_async(hang))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await policy.call_async(succeed)
+
+    assert asyncio.run(main()) == "result"
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_not_retriable_error_is_success():
+    breaker = CircuitBreaker(failure_threshold=2)
+    policy = RetryPolicy(attempts=1, circuit_breaker=breaker)
+
+    for error in (
+        ConnectionError(),
+        CloudShellAPIError(100, "", ""),
+        ConnectionError(),
+    ):
+        with pytest.raises(type(error)):
+            policy.call(Mock(side_effect=error))
+
+    assert not breaker.is_open
+
+
+def test_call_async():
+    calls = []
+
+    async def func(arg):
+        calls.append(arg)
+        if len(calls) < 3:
+            raise ConnectionError("down")
+        return "result"
+
+    policy = RetryPolicy(attempts=3, backoff=0.01)
+
+    assert asyncio.run(policy.call_async(func, "arg")) == "result"
+    assert calls == ["arg"] * 3
+
+
+def test_call_async_timeout():
+    async def func():
+        await asyncio.sleep(1)
+
+    policy = RetryPolicy(attempts=2, backoff=0.01, call_timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(policy.call_async(func))
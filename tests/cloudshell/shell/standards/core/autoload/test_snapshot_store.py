@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from cloudshell.shell.standards.core.autoload.snapshot_store import (
+    ExistedResourceSnapshot,
+    ExistedResourceSnapshotStore,
+)
+
+
+@pytest.fixture()
+def snapshot():
+    return ExistedResourceSnapshot(
+        uniq_id="root id",
+        full_name_to_uniq_id={"Switch/Chassis 1": "id-1", "Switch/Chassis 2": "id-2"},
+        full_name_to_address={"Switch/Chassis 1": "CH1", "Switch/Chassis 2": "CH2"},
+    )
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return ExistedResourceSnapshotStore(tmp_path / "snapshots", ttl=60)
+
+
+def test_save_and_get(store, snapshot):
+    store.save("Switch", snapshot)
+
+    result = store.get("Switch", "root id")
+
+    assert result == snapshot
+    assert result.uniq_id_to_full_name == {
+        "id-1": "Switch/Chassis 1",
+        "id-2": "Switch/Chassis 2",
+    }
+    assert result.address_to_full_name == {
+        "CH1": "Switch/Chassis 1",
+        "CH2": "Switch/Chassis 2",
+    }
+
+
+@pytest.mark.parametrize(
+    ("name", "uniq_id"), [("Switch", "another id"), ("Router", "root id")]
+)
+def test_get_another_resource(store, snapshot, name, uniq_id):
+    store.save("Switch", snapshot)
+
+    assert store.get(name, uniq_id) is None
+
+
+def test_get_expired(store, snapshot):
+    store.save("Switch", snapshot)
+
+    with patch("time.time", return_value=snapshot.created + 61):
+        assert store.get("Switch", "root id") is None
+
+
+def test_invalidate(store, snapshot):
+    store.save("Switch", snapshot)
+
+    store.invalidate("Switch")
+    store.invalidate("Switch")
+
+    assert store.get("Switch", "root id") is None
+
+
+def test_get_broken_file(store, snapshot):
+    store.save("Switch", snapshot)
+    store._get_path("Switch").write_text("{broken")
+
+    assert store.get("Switch", "root id") is None
+
+
+@pytest.mark.parametrize(
+    "changes",
+    (
+        {"names": None},
+        {"names": ["Switch/Chassis 1"]},
+        {"addresses": 1},
+        {"names": [["Switch"], ["Switch/Chassis 1"]]},
+        {"created": "yesterday"},
+    ),
+)
+def test_get_invalid_structure(store, snapshot, changes):
+    store.save("Switch", snapshot)
+    path = store._get_path("Switch")
+    data = json.loads(path.read_text())
+    data.update(changes)
+    data = {k: v for k, v in data.items() if v is not None}
+    path.write_text(json.dumps(data))
+
+    assert store.get("Switch", "root id") is None
+
+
+def test_get_not_dict(store, snapshot):
+    store.save("Switch", snapshot)
+    store._get_path("Switch").write_text("[1, 2]")
+
+    assert store.get("Switch", "root id") is None
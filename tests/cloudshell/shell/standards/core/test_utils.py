@@ -4,6 +4,7 @@ import pytest
 
 from cloudshell.shell.standards.core.utils import (
     InvalidStrValue,
+    get_str_hash,
     split_list_of_values,
     validate_str_for_cs,
 )
@@ -54,3 +55,15 @@ def test_validate_str_for_cs_invalid(str_value):
     with pytest.raises(InvalidStrValue) as exc_info:
         validate_str_for_cs(str_value)
     assert f"'{str_value}'" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "value, expected_hash",
+    [("CH1+Chassis 1", "9165306968188734750"), ("", "-1970711489451281740")],
+)
+def test_get_str_hash(value, expected_hash):
+    assert get_str_hash(value) == expected_hash
+
+
+def test_get_str_hash_legacy():
+    assert get_str_hash("CH1+Chassis 1", legacy=True) == str(hash("CH1+Chassis 1"))
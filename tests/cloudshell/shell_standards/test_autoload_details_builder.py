@@ -1,9 +1,15 @@
+import gc
 import uuid
-from unittest.mock import Mock
+import weakref
+from unittest.mock import Mock, patch
 
 import pytest
 
-from cloudshell.shell.core.driver_context import AutoLoadDetails
+from cloudshell.shell.core.driver_context import (
+    AutoLoadAttribute,
+    AutoLoadDetails,
+    AutoLoadResource,
+)
 
 from cloudshell.shell.standards.autoload_generic_models import (
     GenericChassis,
@@ -12,10 +18,18 @@ from cloudshell.shell.standards.autoload_generic_models import (
     GenericResourceModel,
     GenericSubModule,
 )
+from cloudshell.shell.standards.core.autoload.core_entities import RelativeAddress
+from cloudshell.shell.standards.core.autoload.details_cache import AutoloadDetailsCache
 from cloudshell.shell.standards.core.autoload.existed_resource_info import (
     ExistedResourceInfo,
 )
-from cloudshell.shell.standards.core.autoload.utils import AutoloadDetailsBuilder
+from cloudshell.shell.standards.core.autoload.resource_model import AbstractResource
+from cloudshell.shell.standards.core.autoload.utils import (
+    AutoloadDetailsBuilder,
+    get_branch_children,
+    is_module_without_children,
+)
+from cloudshell.shell.standards.exceptions import BaseStandardException
 
 
 class TestNetworkingResourceModel(GenericResourceModel):
@@ -269,3 +283,503 @@ def test_get_address_from_cs(resource):
     assert module.relative_address == cs_module_addr
     port = next(x for x in result.resources if x.name == "Port 2-3")
     assert port.relative_address == f"{cs_module_addr}/P2-3"
+
+
+class _RecursiveAutoloadDetailsBuilder(AutoloadDetailsBuilder):
+    """The builder with the recursive walk used before, to compare with."""
+
+    def _build_branch(self, resource):
+        resource.shell_name = resource.shell_name or self._resource_model.shell_name
+        autoload_details = AutoLoadDetails([], [])
+        address = self._get_relative_address(resource)
+        if address:
+            autoload_details.resources.append(
+                AutoLoadResource(
+                    model=resource.cloudshell_model_name,
+                    name=resource.name,
+                    relative_address=address,
+                    unique_identifier=self._get_uniq_id(resource),
+                )
+            )
+        for name, value in resource.attributes.items():
+            if value is not None:
+                autoload_details.attributes.append(
+                    AutoLoadAttribute(
+                        relative_address=self._get_relative_address(resource),
+                        attribute_name=str(name),
+                        attribute_value=str(value),
+                    )
+                )
+
+        for child_resource in resource.extract_sub_resources():
+            if not is_module_without_children(child_resource):
+                child_details = self._build_branch(child_resource)
+                autoload_details.resources.extend(child_details.resources)
+                autoload_details.attributes.extend(child_details.attributes)
+        return autoload_details
+
+
+def _create_big_resource(api, modules: int, ports: int):
+    resource = TestNetworkingResourceModel(
+        "resource name", "shell name", "CS_Switch", api
+    )
+    chassis = GenericChassis("1")
+    resource.connect_chassis(chassis)
+    for module_id in range(modules):
+        module = GenericModule(str(module_id))
+        chassis.connect_module(module)
+        for port_id in range(ports):
+            port = GenericPort(f"{module_id}-{port_id}")
+            port.mac_address = "00:00:00:00:00:00"
+            port.port_description = "description"
+            port.bandwidth = 10000
+            module.connect_port(port)
+    return resource
+
+
+def _build(builder_cls, resource):
+    """Build details and count resolving of the relative addresses."""
+    builder = builder_cls(resource, resource._existed_resource_info)
+    with patch.object(
+        builder, "_get_relative_address", wraps=builder._get_relative_address
+    ) as get_relative_address:
+        details = builder.build_details()
+    return details, get_relative_address.call_count
+
+
+def _dump(details):
+    return (
+        [vars(r) for r in details.resources],
+        [vars(a) for a in details.attributes],
+    )
+
+
+def test_build_details_is_same_as_recursive(resource):
+    details = AutoloadDetailsBuilder(
+        resource, resource._existed_resource_info
+    ).build_details()
+    expected = _RecursiveAutoloadDetailsBuilder(
+        resource, resource._existed_resource_info
+    ).build_details()
+
+    assert _dump(details) == _dump(expected)
+
+
+def test_build_details_benchmark(api):
+    # 2k ports with 3 attributes, the address of the resource is cached, so the
+    # gain is from resolving it once per resource instead of once per attribute
+    resource = _create_big_resource(api, 20, 100)
+
+    recursive_details, recursive_calls = _build(
+        _RecursiveAutoloadDetailsBuilder, resource
+    )
+    details, calls = _build(AutoloadDetailsBuilder, resource)
+
+    resources_count = len(details.resources)
+    assert resources_count == 1 + 20 + 20 * 100
+    assert _dump(details) == _dump(recursive_details)
+    # the root resource and every sub resource
+    assert calls == resources_count + 1
+    assert recursive_calls == calls + len(details.attributes)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 50, 1000])
+def test_build_details_iter(resource, chunk_size):
+    expected = _dump(resource.build())
+
+    chunks = list(resource.build_iter(chunk_size))
+
+    resources = [r for chunk in chunks for r in chunk.resources]
+    attributes = [a for chunk in chunks for a in chunk.attributes]
+    assert _dump(AutoLoadDetails(resources, attributes)) == expected
+    # a chunk can be bigger by the attributes of one resource
+    max_attributes = max(
+        len([a for a in attributes if a.relative_address == r.relative_address])
+        for r in resources
+    )
+    for chunk in chunks:
+        size = len(chunk.resources) + len(chunk.attributes)
+        assert 0 < size < chunk_size + max_attributes + 1
+
+
+def test_build_details_iter_is_lazy(api):
+    resource = _create_big_resource(api, 2, 10)
+    ports = [
+        port
+        for module in resource.extract_sub_resources()[0].extract_sub_resources()
+        for port in module.extract_sub_resources()
+    ]
+
+    chunks = resource.build_iter(chunk_size=10)
+    first_chunk = next(chunks)
+
+    assert len(first_chunk.resources) + len(first_chunk.attributes) < 20
+    assert ports[-1].shell_name is None
+    assert len(list(chunks)) > 5
+    assert ports[-1].shell_name == "shell name"
+
+
+def test_build_details_iter_invalid_chunk_size(resource):
+    with pytest.raises(BaseStandardException):
+        list(resource.build_iter(chunk_size=0))
+
+
+def test_get_branch_children(resource):
+    branch_children = get_branch_children(resource)
+
+    names = {
+        resource.name: [child.name for child in branch_children[id(resource)]],
+    }
+    for children in branch_children.values():
+        for child in children:
+            names[child.name + child.parent.name] = [
+                c.name for c in branch_children[id(child)]
+            ]
+    assert names == {
+        "resource name": ["Chassis 1"],
+        "Chassis 1resource name": ["Module 1", "Module 2"],
+        "Module 1Chassis 1": ["SubModule 1", "SubModule 2", "Port 1-3"],
+        "SubModule 1Module 1": ["Port 1-1-1"],
+        "SubModule 2Module 1": ["Port 1-2-1", "Port 1-2-2"],
+        "Port 1-1-1SubModule 1": [],
+        "Port 1-2-1SubModule 2": [],
+        "Port 1-2-2SubModule 2": [],
+        "Port 1-3Module 1": [],
+        "Module 2Chassis 1": ["Port 2-3"],
+        "Port 2-3Module 2": [],
+    }
+
+
+def test_pruning_visits_every_resource_once(resource):
+    extract_sub_resources = AbstractResource.extract_sub_resources
+
+    with patch.object(
+        AbstractResource,
+        "extract_sub_resources",
+        autospec=True,
+        side_effect=extract_sub_resources,
+    ) as mocked:
+        resource.build()
+
+    # resource, chassis, 4 modules, 5 sub modules, 5 ports
+    assert mocked.call_count == 16
+
+
+def _create_builder(resource, existed_addresses):
+    ex_res = resource._existed_resource_info
+    ex_res.wait_until_loaded()
+    ex_res._address_to_full_name = {
+        addr: f"{resource.name}/{addr}" for addr in existed_addresses
+    }
+    return AutoloadDetailsBuilder(resource, ex_res)
+
+
+def test_make_addr_uniq(resource):
+    builder = _create_builder(resource, ["CH1/M1", "CH1/M1-0", "CH1/M1-2"])
+
+    assert builder._make_addr_uniq("CH1/M1") == "CH1/M1-1"
+    # the same resource gets the same address
+    assert builder._make_addr_uniq("CH1/M1") == "CH1/M1-1"
+    # generated addresses are unique too
+    assert builder._make_addr_uniq("CH1/M1-1") == "CH1/M1-1-0"
+    assert builder._make_addr_uniq("CH1/M1-0") == "CH1/M1-0-0"
+    assert builder._make_addr_uniq("CH1/M2") == "CH1/M2"
+    assert builder._make_addr_uniq("CH1/M2-0") == "CH1/M2-0"
+
+
+def test_build_details_with_generated_address_collision(resource):
+    # Module 1 is moved to CH1/M1-0 and CH1/M1-0 is taken by Module 2
+    ex_res = resource._existed_resource_info
+    ex_res.wait_until_loaded()
+    chassis = resource.extract_sub_resources()[0]
+    module2 = chassis.extract_sub_resources()[1]
+    module2.relative_address.native_index = "1-0"
+    ex_res._address_to_full_name = {"CH1/M1": "resource name/Chassis 1/Module M1"}
+
+    result = resource.build()
+
+    addresses = {r.name: r.relative_address for r in result.resources}
+    assert addresses["Module 1"] == "CH1/M1-0"
+    assert addresses["Module 1-0"] == "CH1/M1-0-0"
+    assert addresses["Port 2-3"] == "CH1/M1-0-0/P2-3"
+    assert len(set(addresses.values())) == len(addresses)
+
+
+def test_make_addr_uniq_checks_every_suffix_once(resource):
+    builder = _create_builder(
+        resource, ["CH1/M1"] + [f"CH1/M1-{i}" for i in range(1000)]
+    )
+    ex_res = builder._existed_resource_info
+
+    with patch.object(
+        ex_res, "is_address_exists", wraps=ex_res.is_address_exists
+    ) as is_address_exists:
+        addresses = [builder._make_addr_uniq("CH1/M1") for _ in range(100)]
+        addresses.append(builder._make_addr_uniq("CH1/M1-1000"))
+        addresses.append(builder._make_addr_uniq("CH1/M1-1001"))
+
+    assert addresses[-3:] == ["CH1/M1-1000", "CH1/M1-1000-0", "CH1/M1-1001"]
+    assert is_address_exists.call_count == 1002 + 1 + 1
+
+
+def test_names_and_addresses_built_once_benchmark(api):
+    # the recursive properties built about 50 addresses and 10 names per port
+    resource = _create_big_resource(api, 20, 100)
+
+    with patch.object(
+        AbstractResource,
+        "_gen_name",
+        autospec=True,
+        side_effect=AbstractResource._gen_name,
+    ) as gen_name, patch.object(
+        RelativeAddress,
+        "_build_full_address",
+        autospec=True,
+        side_effect=RelativeAddress._build_full_address,
+    ) as build_full_address:
+        details = resource.build()
+
+    resources_count = len(details.resources)
+    assert resources_count == 1 + 20 + 20 * 100
+    assert gen_name.call_count == resources_count
+    assert build_full_address.call_count == resources_count + 1
+
+
+def test_legacy_unique_ids(api):
+    resource = TestNetworkingResourceModel(
+        "resource name", "shell name", "CS_Switch", api, legacy_unique_ids=True
+    )
+    resource.connect_chassis(GenericChassis("1"))
+    r_info = resource._existed_resource_info
+
+    details = resource.build()
+
+    chassis_id = str(hash("CH1+Chassis 1"))
+    assert details.resources[0].unique_identifier == str(
+        hash(f"{r_info.uniq_id}+{chassis_id}")
+    )
+
+
+def test_unique_ids_are_stable(api):
+    api.GetResourceDetails = lambda x: Mock(
+        UniqeIdentifier="uniq id", ChildResources=[]
+    )
+    resource = TestNetworkingResourceModel(
+        "resource name", "shell name", "CS_Switch", api
+    )
+    resource.connect_chassis(GenericChassis("1"))
+
+    details = resource.build()
+
+    # hash() of the strings is different in every process
+    assert details.resources[0].unique_identifier == "-3517895186617795498"
+
+
+def _create_stable_api():
+    return Mock(
+        GetResourceDetails=lambda x: Mock(UniqeIdentifier="uniq id", ChildResources=[])
+    )
+
+
+def test_build_details_with_cache():
+    cache = AutoloadDetailsCache()
+    expected = _dump(_create_resource(_create_stable_api()).build())
+    assert _dump(_create_resource(_create_stable_api()).build(cache)) == expected
+    assert len(cache) == 11
+
+    resource = _create_resource(_create_stable_api())
+    with patch.object(
+        AutoloadDetailsBuilder,
+        "_add_autoload_details",
+        autospec=True,
+        side_effect=AutoloadDetailsBuilder._add_autoload_details,
+    ) as add_autoload_details:
+        details = resource.build(cache)
+
+    assert _dump(details) == expected
+    # the whole output is reused
+    assert add_autoload_details.call_count == 0
+
+
+def test_build_details_with_cache_rebuilds_changed_branch():
+    cache = AutoloadDetailsCache()
+    _create_resource(_create_stable_api()).build(cache)
+    resource = _create_resource(_create_stable_api())
+    chassis = resource.extract_sub_resources()[0]
+    sub_module = chassis.extract_sub_resources()[0].extract_sub_resources()[1]
+    port = sub_module.extract_sub_resources()[0]
+    port.mac_address = "00:11:22:33:44:55"
+    expected = _dump(_create_resource(_create_stable_api()).build())
+
+    with patch.object(
+        AutoloadDetailsBuilder,
+        "_add_autoload_details",
+        autospec=True,
+        side_effect=AutoloadDetailsBuilder._add_autoload_details,
+    ) as add_autoload_details:
+        details = resource.build(cache)
+
+    rebuilt = [call[0][1].name for call in add_autoload_details.call_args_list]
+    assert rebuilt == [
+        "resource name",
+        "Chassis 1",
+        "Module 1",
+        "SubModule 2",
+        "Port 1-2-1",
+    ]
+    port_attributes = [
+        a for a in details.attributes if a.relative_address == "CH1/M1/SM2/P1-2-1"
+    ]
+    assert port_attributes[-1].attribute_value == "00:11:22:33:44:55"
+    resources, attributes = _dump(details)
+    assert resources == expected[0]
+    assert len(attributes) == len(expected[1]) + 1
+
+
+def _build_with_cache_and_count(resource, cache):
+    """Build details and return names of the rebuilt resources."""
+    with patch.object(
+        AutoloadDetailsBuilder,
+        "_add_autoload_details",
+        autospec=True,
+        side_effect=AutoloadDetailsBuilder._add_autoload_details,
+    ) as add_autoload_details:
+        details = resource.build(cache)
+    rebuilt = [call[0][1].name for call in add_autoload_details.call_args_list]
+    return details, rebuilt
+
+
+def test_build_details_with_cache_keeps_subtrees_of_reused_output():
+    cache = AutoloadDetailsCache()
+    expected = _dump(_create_resource(_create_stable_api()).build())
+    _create_resource(_create_stable_api()).build(cache)
+
+    details, rebuilt = _build_with_cache_and_count(
+        _create_resource(_create_stable_api()), cache
+    )
+    assert rebuilt == []
+    assert len(cache) == 11
+
+    resource = _create_resource(_create_stable_api())
+    chassis = resource.extract_sub_resources()[0]
+    module = chassis.extract_sub_resources()[1]
+    module.extract_sub_resources()[-1].mac_address = "00:11:22:33:44:55"
+    details, rebuilt = _build_with_cache_and_count(resource, cache)
+
+    assert rebuilt == ["resource name", "Chassis 1", "Module 2", "Port 2-3"]
+    assert len(cache) == 11
+    resources, attributes = _dump(details)
+    assert resources == expected[0]
+    assert len(attributes) == len(expected[1]) + 1
+
+    details, rebuilt = _build_with_cache_and_count(resource, cache)
+    assert rebuilt == []
+    assert _dump(details) == (resources, attributes)
+
+
+def test_build_details_with_cache_root_uniq_id_changed():
+    cache = AutoloadDetailsCache()
+    _create_resource(_create_stable_api()).build(cache)
+    api = Mock(
+        GetResourceDetails=lambda x: Mock(UniqeIdentifier="new id", ChildResources=[])
+    )
+    expected = _dump(_create_resource(api).build())
+
+    details, rebuilt = _build_with_cache_and_count(_create_resource(api), cache)
+
+    assert _dump(details) == expected
+    assert len(rebuilt) == 11
+
+
+def _iter_resources(resource):
+    yield resource
+    for child in resource.extract_sub_resources():
+        if not is_module_without_children(child):
+            yield from _iter_resources(child)
+
+
+def test_build_details_delta(resource):
+    ex_res = resource._existed_resource_info
+    ex_res.wait_until_loaded()
+    resources = {r.name: r for r in _iter_resources(resource)}
+    previous = resource.build()
+    # the previous details are in the CloudShell except the Port 2-3
+    ex_res._full_name_to_address = {
+        r.full_name: str(r.relative_address)
+        for r in resources.values()
+        if r is not resource and r.name != "Port 2-3"
+    }
+    ex_res._full_name_to_address["resource name/Chassis 2"] = "CH2"
+    resources["Port 1-3"].mac_address = "00:11:22:33:44:55"
+
+    delta = resource.build_delta(previous, include_orphans=True)
+
+    assert delta.new == ["resource name/Chassis 1/Module 2/Port 2-3"]
+    assert delta.changed == ["resource name/Chassis 1/Module 1/Port 1-3"]
+    assert len(delta.unchanged) == len(resources) - 2
+    assert delta.orphans == ["resource name/Chassis 2"]
+    assert [r.name for r in delta.details.resources] == ["Port 1-3", "Port 2-3"]
+    assert [
+        (a.relative_address, a.attribute_name, a.attribute_value)
+        for a in delta.details.attributes
+    ] == [
+        ("CH1/M1/P1-3", "shell name.GenericPort.MAC Address", "00:11:22:33:44:55"),
+        ("CH1/M2/P2-3", "CS_Port.Model Name", "port-2-3"),
+    ]
+
+
+def test_build_details_delta_without_previous_details(resource):
+    ex_res = resource._existed_resource_info
+    ex_res.wait_until_loaded()
+    ex_res._full_name_to_address = {"resource name/Chassis 1": "CH1"}
+
+    delta = resource.build_delta()
+
+    assert delta.changed == ["resource name/Chassis 1"]
+    assert delta.unchanged == ["resource name"]
+    assert len(delta.details.resources) == len(resource.build().resources)
+    assert delta.orphans == []
+
+
+@pytest.mark.parametrize(
+    ("max_resources", "max_attributes"), [(1, 10), (3, 2), (4, 100), (100, 100)]
+)
+def test_build_pages(resource, max_resources, max_attributes):
+    expected = _dump(resource.build())
+
+    pages = resource.build_pages(max_resources, max_attributes)
+
+    resources = [r for page in pages for r in page.resources]
+    attributes = [a for page in pages for a in page.attributes]
+    assert _dump(AutoLoadDetails(resources, attributes)) == expected
+    seen_addresses = {""}
+    for page in pages:
+        assert len(page.resources) <= max_resources
+        assert len(page.attributes) <= max_attributes
+        page_addresses = {r.relative_address for r in page.resources}
+        for r in page.resources:
+            parent_address = r.relative_address.rpartition("/")[0]
+            assert parent_address in seen_addresses | page_addresses
+        for a in page.attributes:
+            assert a.relative_address in page_addresses or a.relative_address == ""
+        seen_addresses |= page_addresses
+
+
+def test_build_pages_attributes_dont_fit(resource):
+    resource.vendor = "vendor"
+    resource.model = "model"
+
+    with pytest.raises(BaseStandardException, match="2 attributes"):
+        resource.build_pages(max_attributes=1)
+
+
+def test_built_model_is_garbage_collected(api):
+    resource = _create_resource(api)
+    resource.build()
+    port = resource.extract_sub_resources()[0].extract_sub_resources()[0]
+    refs = [weakref.ref(resource), weakref.ref(port)]
+
+    del resource, port
+    gc.collect()
+
+    assert [ref() for ref in refs] == [None, None]
@@ -1,7 +1,17 @@
+from unittest.mock import Mock
+
+import pytest
+
 from cloudshell.shell.standards.autoload_generic_models import (
+    GenericChassis,
+    GenericModule,
+    GenericPort,
+    GenericPowerPort,
     GenericResourceModel,
+    GenericSubModule,
     ResourcePort,
 )
+from cloudshell.shell.standards.exceptions import ResourceModelException
 
 
 class ResourceModel(GenericResourceModel):
@@ -73,3 +83,85 @@ def test_resource_build(api):
     }
 
     assert expected_attributes == resource_attributes
+
+
+def _create_chassis_with_ports(api, connect_ports: bool) -> ResourceModel:
+    resource = ResourceModel("resource name", "shell name", "Family Name", api)
+    chassis = GenericChassis("1")
+    resource.connect_chassis(chassis)
+    module = GenericModule("1")
+    chassis.connect_module(module)
+    indexes = [str(i) for i in range(5)]
+    names = [f"Gi0-{i}" for i in range(5)]
+    macs = [f"00:11:22:33:44:{i:02}" for i in range(5)]
+    mtus = [1500, 9000, 0, None, 1500]
+    descriptions = ["d" * 3000, "", "desc", None, "desc"]
+    if connect_ports:
+        module.connect_ports(
+            indexes,
+            names,
+            mac_address=macs,
+            mtu=mtus,
+            port_description=descriptions,
+        )
+    else:
+        for index, name, mac, mtu, description in zip(
+            indexes, names, macs, mtus, descriptions
+        ):
+            port = GenericPort(index, name=name)
+            port.mac_address = mac
+            port.mtu = mtu
+            port.port_description = description
+            module.connect_port(port)
+    return resource
+
+
+def test_connect_ports_same_as_connect_port():
+    # the same unique id of the existed resource for both builds
+    api = Mock(
+        GetResourceDetails=lambda x: Mock(UniqeIdentifier="uniq id", ChildResources=[])
+    )
+    expected = _create_chassis_with_ports(api, connect_ports=False).build()
+    details = _create_chassis_with_ports(api, connect_ports=True).build()
+
+    assert [vars(r) for r in details.resources] == [vars(r) for r in expected.resources]
+    assert [vars(a) for a in details.attributes] == [
+        vars(a) for a in expected.attributes
+    ]
+
+
+def test_connect_ports():
+    sub_module = GenericSubModule("1")
+    ports = sub_module.connect_ports(
+        range(1, 4),
+        unique_ids=["a", "b", "c"],
+        port_cls=ResourcePort,
+        port_speed=[1] * 3,
+    )
+
+    assert sub_module.extract_sub_resources() == tuple(ports)
+    assert [p.name for p in ports] == ["Port 1", "Port 2", "Port 3"]
+    assert [p.unique_identifier for p in ports] == ["a", "b", "c"]
+    assert [str(p.relative_address) for p in ports] == ["SM1/P1", "SM1/P2", "SM1/P3"]
+    assert all(p.parent is sub_module for p in ports)
+    assert all(p.port_speed == 1 for p in ports)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    (
+        ({"names": ["Port 1"]}, "Column names has 1 values, expected 2"),
+        ({"mtu": [1500]}, "Column mtu has 1 values, expected 2"),
+        ({"speed": [1, 2]}, "Class GenericPort hasn't attribute speed"),
+        (
+            {"port_cls": GenericPowerPort},
+            "Class GenericPowerPort not allowed to connect to GenericChassis",
+        ),
+    ),
+)
+def test_connect_ports_invalid_columns(kwargs, error):
+    chassis = GenericChassis("1")
+
+    with pytest.raises(ResourceModelException, match=error):
+        chassis.connect_ports(["1", "2"], **kwargs)
+    assert chassis.extract_sub_resources() == ()